@@ -3,11 +3,36 @@
 from argparse import ArgumentParser
 from typing import Any, final
 
-from django.core.management import call_command
 from pyrig.src.testing.assertions import assert_with_msg
+from pytest_mock import MockerFixture
 
 from winidjango.src.commands.base.base import ABCBaseCommand
 
+_ABSTRACT_METHODS: frozenset[str] = ABCBaseCommand.__abstractmethods__
+
+
+def _collect_option_strings(parser: ArgumentParser) -> frozenset[str]:
+    """Collect all option strings that were added to the parser.
+
+    Skips the help action that argparse always registers first.
+    """
+    actions = parser._actions  # noqa: SLF001
+    if parser.add_help:
+        actions = actions[1:]
+    return frozenset[str]().union(*(action.option_strings for action in actions))
+
+
+class _NoopCommand(ABCBaseCommand):
+    """Minimal concrete command shared by tests that need no custom behaviour."""
+
+    @final
+    def add_command_arguments(self, parser: ArgumentParser) -> None:
+        """Required implementation."""
+
+    @final
+    def handle_command(self) -> None:
+        """Required implementation."""
+
 
 class TestABCBaseCommand:
     """Test class for ABCBaseCommand."""
@@ -33,30 +58,21 @@ class TestABCBaseCommand:
         command.add_arguments(parser)
 
         # Verify that both base and custom arguments were added
-        added_arguments: set[str] = set()
-        for action in parser._actions:  # noqa: SLF001
-            if action.option_strings:
-                added_arguments.update(action.option_strings)
+        added_arguments = _collect_option_strings(parser)
 
         assert_with_msg(
             command.add_command_arguments_called,
             "Expected add_command_arguments to be called",
         )
+        assert_with_msg(
+            {f"--{TestCommand.Options.DRY_RUN}", "--custom"} <= added_arguments,
+            f"Expected base and custom arguments to be added, got {added_arguments}",
+        )
 
     def test_base_add_arguments(self) -> None:
         """Test method for _add_arguments."""
-
         # Test that _add_arguments adds all expected common arguments
-        class TestCommand(ABCBaseCommand):
-            @final
-            def add_command_arguments(self, parser: ArgumentParser) -> None:
-                """Required implementation."""
-
-            @final
-            def handle_command(self) -> None:
-                """Required implementation."""
-
-        command = TestCommand()
+        command = _NoopCommand()
         parser = ArgumentParser()
 
         # Call _add_arguments directly
@@ -64,16 +80,13 @@ class TestABCBaseCommand:
 
         # Test that all expected arguments were added
         expected_arguments = {
-            f"--{TestCommand.Options.DRY_RUN}",
-            f"--{TestCommand.Options.FORCE}",
-            f"--{TestCommand.Options.DELETE}",
+            f"--{_NoopCommand.Options.DRY_RUN}",
+            f"--{_NoopCommand.Options.FORCE}",
+            f"--{_NoopCommand.Options.DELETE}",
         }
 
         # Get all argument names from parser
-        added_arguments: set[str] = set()
-        for action in parser._actions:  # noqa: SLF001
-            if action.option_strings:
-                added_arguments.update(action.option_strings)
+        added_arguments = _collect_option_strings(parser)
 
         for expected_arg in expected_arguments:
             assert_with_msg(
@@ -84,11 +97,8 @@ class TestABCBaseCommand:
     def test_add_command_arguments(self) -> None:
         """Test method for add_command_arguments."""
         # Test that add_command_arguments is abstract and must be implemented
-        abstract_methods: set[str] = getattr(
-            ABCBaseCommand, "__abstractmethods__", set()
-        )
         assert_with_msg(
-            "add_command_arguments" in abstract_methods,
+            "add_command_arguments" in _ABSTRACT_METHODS,
             "Expected add_command_arguments to be abstract",
         )
 
@@ -115,54 +125,31 @@ class TestABCBaseCommand:
         command.add_command_arguments(parser)
 
         # Check that custom argument was added
-        added_arguments: set[str] = set()
-        for action in parser._actions:  # noqa: SLF001
-            if action.option_strings:
-                added_arguments.update(action.option_strings)
+        added_arguments = _collect_option_strings(parser)
 
         assert_with_msg(
             "--test-arg" in added_arguments,
             "Expected custom argument --test-arg to be added",
         )
 
-    def test_handle(self) -> None:
+    def test_handle(self, mocker: MockerFixture) -> None:
         """Test method for handle."""
-
         # Test that handle follows template method pattern correctly
-        class TestCommand(ABCBaseCommand):
-            @final
-            def add_command_arguments(self, parser: ArgumentParser) -> None:
-                """Required implementation."""
-
-            @final
-            def handle_command(self) -> None:
-                """Track that this method was called."""
-                self.handle_command_called = True
-
-        command = TestCommand()
+        command = _NoopCommand()
+        spy = mocker.spy(command, command.handle_command.__name__)
 
         # Test the template method pattern
         command.handle()
 
         assert_with_msg(
-            command.handle_command_called,
+            spy.call_count == 1,
             "Expected handle_command to be called by handle",
         )
 
     def test_base_handle(self) -> None:
         """Test method for _handle."""
-
         # Test that _handle logs all command options correctly
-        class TestCommand(ABCBaseCommand):
-            @final
-            def add_command_arguments(self, parser: ArgumentParser) -> None:
-                """Required implementation."""
-
-            @final
-            def handle_command(self) -> None:
-                """Required implementation."""
-
-        command = TestCommand()
+        command = _NoopCommand()
 
         # test it sets args and options correctly
         args = ("test_arg",)
@@ -177,29 +164,17 @@ class TestABCBaseCommand:
             f"Expected options to be {options}, got {command.options}",
         )
 
-    def test_handle_command(self) -> None:
+    def test_handle_command(self, mocker: MockerFixture) -> None:
         """Test method for handle_command."""
         # Test that handle_command is abstract and must be implemented
-        abstract_methods: set[str] = getattr(
-            ABCBaseCommand, "__abstractmethods__", set()
-        )
         assert_with_msg(
-            "handle_command" in abstract_methods,
+            "handle_command" in _ABSTRACT_METHODS,
             "Expected handle_command to be abstract",
         )
 
         # Test that concrete implementation works correctly
-        class ConcreteTestCommand(ABCBaseCommand):
-            @final
-            def add_command_arguments(self, parser: ArgumentParser) -> None:
-                """Required implementation."""
-
-            @final
-            def handle_command(self, *_args: Any, **_options: Any) -> None:
-                """Required implementation that will be logged."""
-                self.handle_command_called = True
-
-        command = ConcreteTestCommand()
+        command = _NoopCommand()
+        spy = mocker.spy(command, command.handle_command.__name__)
 
         # Verify that the method exists and can be called
         assert_with_msg(
@@ -210,7 +185,7 @@ class TestABCBaseCommand:
         # Test that the method can be called without errors
         command.handle()
         assert_with_msg(
-            command.handle_command_called,
+            spy.call_count == 1,
             "Expected handle_command to be called by handle",
         )
 
@@ -233,9 +208,11 @@ class TestABCBaseCommand:
                 """Required implementation."""
                 self.extra_option = self.get_option(self.Options.EXTRA)
 
-        # call the command with djangos call_command
+        # set the options directly instead of going through argparse
         cmd = TestCommand()
-        call_command(cmd, extra="test")
+        cmd.args = ()
+        cmd.options = {TestCommand.Options.EXTRA: "test"}
+        cmd.handle_command()
         assert_with_msg(
             cmd.extra_option == "test",
             f"Expected extra_option to be 'test', got {cmd.extra_option}",
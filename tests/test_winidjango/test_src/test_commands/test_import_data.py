@@ -2,7 +2,7 @@
 
 from argparse import ArgumentParser
 from collections.abc import Callable, Iterable
-from typing import Any
+from typing import Any, ClassVar, cast
 
 import polars as pl
 import pytest
@@ -12,7 +12,9 @@ from pytest_mock import MockerFixture
 from winiutils.src.data.dataframe.cleaning import CleaningDF
 
 from tests.models import ModelA, ModelB
+from winidjango.src.commands import import_data
 from winidjango.src.commands.import_data import ImportDataBaseCommand
+from winidjango.src.db.bulk import STANDARD_BULK_SIZE, bulk_create_bulks_in_steps
 
 
 class MyCleaningDF(CleaningDF):
@@ -21,49 +23,58 @@ class MyCleaningDF(CleaningDF):
     STR_COL = "str_col"
     INT_COL = "int_col"
 
+    # constant return values, allocated once instead of on every getter call
+    RENAME_MAP: ClassVar[dict[str, str]] = {
+        STR_COL: "str_col_old",
+        INT_COL: "int_col_old",
+    }
+    COL_DTYPE_MAP: ClassVar[dict[str, type[pl.DataType]]] = {
+        STR_COL: pl.Utf8,
+        INT_COL: pl.Int64,
+    }
+    DROP_NULL_SUBSETS = ((STR_COL, INT_COL),)
+    FILL_NULL_MAP: ClassVar[dict[str, Any]] = {
+        STR_COL: "",
+        INT_COL: 0,
+    }
+    SORT_COLS = ((INT_COL, False), (STR_COL, True))
+    UNIQUE_SUBSETS = ((STR_COL, INT_COL),)
+    NO_NULL_COLS = (STR_COL, INT_COL)
+
     @classmethod
     def get_rename_map(cls) -> dict[str, str]:
         """Test implementation of rename_map."""
-        return {
-            cls.STR_COL: "str_col_old",
-            cls.INT_COL: "int_col_old",
-        }
+        return cls.RENAME_MAP
 
     @classmethod
     def get_col_dtype_map(cls) -> dict[str, type[pl.DataType]]:
         """Test implementation of col_cls_map."""
-        return {
-            cls.STR_COL: pl.Utf8,
-            cls.INT_COL: pl.Int64,
-        }
+        return cls.COL_DTYPE_MAP
 
     @classmethod
     def get_drop_null_subsets(cls) -> tuple[tuple[str, ...], ...]:
         """Test implementation of drop_null_subsets."""
-        return ((cls.STR_COL, cls.INT_COL),)
+        return cls.DROP_NULL_SUBSETS
 
     @classmethod
     def get_fill_null_map(cls) -> dict[str, Any]:
         """Test implementation of fill_null_map."""
-        return {
-            cls.STR_COL: "",
-            cls.INT_COL: 0,
-        }
+        return cls.FILL_NULL_MAP
 
     @classmethod
     def get_sort_cols(cls) -> tuple[tuple[str, bool], ...]:
         """Test implementation of sort_cols."""
-        return ((cls.INT_COL, False), (cls.STR_COL, True))
+        return cls.SORT_COLS
 
     @classmethod
     def get_unique_subsets(cls) -> tuple[tuple[str, ...], ...]:
         """Test implementation of unique_subsets."""
-        return ((cls.STR_COL, cls.INT_COL),)
+        return cls.UNIQUE_SUBSETS
 
     @classmethod
     def get_no_null_cols(cls) -> tuple[str, ...]:
         """Test implementation of not_null_cols."""
-        return (cls.STR_COL, cls.INT_COL)
+        return cls.NO_NULL_COLS
 
     @classmethod
     def get_col_converter_map(
@@ -87,6 +98,17 @@ class MyCleaningDF(CleaningDF):
         return {}
 
 
+@pytest.fixture(scope="module")
+def cleaned_df() -> pl.DataFrame:
+    """Fixture for already cleaned data, built once per module."""
+    return pl.DataFrame(
+        {
+            MyCleaningDF.STR_COL: ["a", "b", "c"],
+            MyCleaningDF.INT_COL: [1, 2, 3],
+        }
+    )
+
+
 @pytest.fixture
 def import_data_command() -> type[ImportDataBaseCommand]:
     """Fixture for ImportDataBaseCommand."""
@@ -114,9 +136,12 @@ def import_data_command() -> type[ImportDataBaseCommand]:
             self, df: pl.DataFrame
         ) -> dict[type[Model], Iterable[Model]]:
             """Required implementation."""
+            # extract whole columns once instead of building a dict per row
+            str_col = df[MyCleaningDF.STR_COL].to_list()
+            int_col = df[MyCleaningDF.INT_COL].to_list()
             bulk_a = [
-                ModelA(str_field=r["str_col"], int_field=r["int_col"])
-                for r in df.iter_rows(named=True)
+                ModelA(str_field=str_value, int_field=int_value)
+                for str_value, int_value in zip(str_col, int_col, strict=True)
             ]
             bulk_b = [ModelB(model_a=model_a) for model_a in bulk_a]
             return {
@@ -130,7 +155,6 @@ def import_data_command() -> type[ImportDataBaseCommand]:
 class TestImportDataBaseCommand:
     """Test class for ImportDataBaseCommand."""
 
-    @pytest.mark.django_db
     def test_handle_import(
         self, import_data_command: type[ImportDataBaseCommand]
     ) -> None:
@@ -139,8 +163,9 @@ class TestImportDataBaseCommand:
         df = cmd.handle_import()
 
         # just assert that it returns a dataframe
+        # an exact type check on purpose, the fixture returns a plain DataFrame
         assert_with_msg(
-            isinstance(df, pl.DataFrame),
+            type(df) is pl.DataFrame,
             f"Expected dataframe, got {type(df)}",
         )
 
@@ -157,25 +182,21 @@ class TestImportDataBaseCommand:
         )
 
     def test_get_bulks_by_model(
-        self, import_data_command: type[ImportDataBaseCommand]
+        self,
+        import_data_command: type[ImportDataBaseCommand],
+        cleaned_df: pl.DataFrame,
     ) -> None:
         """Test method for get_bulks_by_model."""
         cmd = import_data_command()
-        bulk_by_model = cmd.get_bulks_by_model(
-            pl.DataFrame(
-                {
-                    "str_col": ["a", "b", "c"],
-                    "int_col": [1, 2, 3],
-                }
-            )
-        )
+        bulk_by_model = cmd.get_bulks_by_model(cleaned_df)
 
         assert_with_msg(
             set(bulk_by_model.keys()) == {ModelA, ModelB},
             f"Expected {{ModelA, ModelB}}, got {bulk_by_model.keys()}",
         )
-        bulk_a = list(bulk_by_model[ModelA])
-        bulk_b = list(bulk_by_model[ModelB])
+        # the fixture returns lists, so no copy is needed to measure them
+        bulk_a = cast("list[ModelA]", bulk_by_model[ModelA])
+        bulk_b = cast("list[ModelB]", bulk_by_model[ModelB])
         expected_len = 3
         assert_with_msg(
             len(bulk_a) == expected_len,
@@ -194,8 +215,18 @@ class TestImportDataBaseCommand:
     ) -> None:
         """Test method for handle_command."""
         cmd = import_data_command()
+        # handle_command is called directly, so set the options base_handle sets
+        cmd.options = {}
+        create_spy = mocker.spy(import_data, bulk_create_bulks_in_steps.__name__)
         cmd.handle_command()
 
+        # without options the bulks are created in standard steps
+        step = create_spy.call_args.kwargs["step"]
+        assert_with_msg(
+            step == STANDARD_BULK_SIZE,
+            f"Expected {STANDARD_BULK_SIZE} as step, got {step}",
+        )
+
         # mock get data to return empty dataframe
         mocker.patch.object(
             cmd,
@@ -209,6 +240,23 @@ class TestImportDataBaseCommand:
         )
         cmd.handle_command()
 
+        # lazy frames are collected before cleaning
+        mocker.patch.object(
+            cmd,
+            "handle_import",
+            return_value=pl.LazyFrame(
+                {
+                    "str_col_old": ["d"],
+                    "int_col_old": [4],
+                }
+            ),
+        )
+        cmd.handle()
+        assert_with_msg(
+            cmd.cleaning_df.df.height == 1,
+            f"Expected 1 cleaned row, got {cmd.cleaning_df.df.height}",
+        )
+
     @pytest.mark.django_db
     def test_import_to_db(
         self, import_data_command: type[ImportDataBaseCommand], mocker: MockerFixture
@@ -216,16 +264,26 @@ class TestImportDataBaseCommand:
         """Test method for import_to_db."""
         cmd = import_data_command()
         spy = mocker.spy(cmd, cmd.import_to_db.__name__)
-        cmd.handle_command()
+        create_spy = mocker.spy(import_data, bulk_create_bulks_in_steps.__name__)
+        # a batch size smaller than the data makes the bulks go in several steps
+        batch_size = 2
+        cmd.handle(**{cmd.Options.BATCH_SIZE: batch_size})
         spy.assert_called_once()
+        step = create_spy.call_args.kwargs["step"]
+        assert_with_msg(
+            step == batch_size,
+            f"Expected the batch size option {batch_size} as step, got {step}",
+        )
 
         # test the data
         expected_num = 3
+        a_count = ModelA.objects.count()
+        b_count = ModelB.objects.count()
         assert_with_msg(
-            ModelA.objects.count() == expected_num,
-            f"Expected {expected_num} ModelA objects, got {ModelA.objects.count()}",
+            a_count == expected_num,
+            f"Expected {expected_num} ModelA objects, got {a_count}",
         )
         assert_with_msg(
-            ModelB.objects.count() == expected_num,
-            f"Expected {expected_num} ModelB objects, got {ModelB.objects.count()}",
+            b_count == expected_num,
+            f"Expected {expected_num} ModelB objects, got {b_count}",
         )
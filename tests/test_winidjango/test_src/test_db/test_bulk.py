@@ -1,12 +1,16 @@
 """Tests for winidjango.bulk module."""
 
+import sys
+import threading
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast
 
 import pytest
-from django.db import models
+from django.db import connection, models
+from django.db.models import F, Value
 from pyrig.src.modules.module import make_obj_importpath
 from pyrig.src.testing.assertions import assert_with_msg
+from pytest_mock import MockerFixture
 
 from tests.models import ModelA, ModelB
 from winidjango.src.db import bulk
@@ -14,16 +18,22 @@ from winidjango.src.db.bulk import (
     MODE_CREATE,
     MODE_DELETE,
     MODE_UPDATE,
+    STANDARD_DB_BATCH_SIZE,
     bulk_create_bulks_in_steps,
     bulk_create_in_steps,
+    bulk_create_with_copy,
     bulk_delete,
     bulk_delete_in_steps,
     bulk_method_in_steps,
     bulk_method_in_steps_atomic,
     bulk_update_in_steps,
+    bulk_update_with_values,
+    can_bulk_create_with_copy,
+    can_bulk_update_with_values,
     flatten_bulk_in_steps_result,
     get_bulk_method,
     get_differences_between_bulks,
+    get_standard_db_batch_size,
     get_step_chunks,
     multi_simulate_bulk_deletion,
     simulate_bulk_deletion,
@@ -31,11 +41,172 @@ from winidjango.src.db.bulk import (
 from winidjango.src.db.fields import get_fields
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from django.db.models import Model
 
 
+class BulkMethodTestModel(models.Model):
+    """Test model for get_bulk_method."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for BulkMethodTestModel."""
+
+        app_label = "test_get_bulk_method"
+
+    def __str__(self) -> str:
+        """String representation of BulkMethodTestModel."""
+        return self.name
+
+
+class FlattenTestModel(models.Model):
+    """Test model for flatten_bulk_in_steps_result."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for FlattenTestModel."""
+
+        app_label = "test_flatten"
+
+    def __str__(self) -> str:
+        """String representation of FlattenTestModel."""
+        return self.name
+
+
+class BulkDeleteTestModel(models.Model):
+    """Test model for bulk_delete."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for BulkDeleteTestModel."""
+
+        app_label = "test_bulk_delete"
+
+    def __str__(self) -> str:
+        """String representation of BulkDeleteTestModel."""
+        return self.name
+
+
+class DiffTestModel(models.Model):
+    """Test model for get_differences_between_bulks."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta:
+        """Meta class for DiffTestModel."""
+
+        app_label = "test_differences"
+
+    def __str__(self) -> str:
+        """String representation of DiffTestModel."""
+        return self.name
+
+
+class OtherModel(models.Model):
+    """Other test model."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for OtherModel."""
+
+        app_label = "test_differences_other"
+
+    def __str__(self) -> str:
+        """String representation of OtherModel."""
+        return self.name
+
+
+class SimulateDeleteTestModel(models.Model):
+    """Test model for simulate_bulk_deletion."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for SimulateDeleteTestModel."""
+
+        app_label = "test_simulate_delete"
+
+    def __str__(self) -> str:
+        """String representation of SimulateDeleteTestModel."""
+        return self.name
+
+
+class MultiDeleteModel1(models.Model):
+    """Test model 1 for multi_simulate_bulk_deletion."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for MultiDeleteModel1."""
+
+        app_label = "test_multi_delete_1"
+
+    def __str__(self) -> str:
+        """String representation of MultiDeleteModel1."""
+        return self.name
+
+
+class MultiDeleteModel2(models.Model):
+    """Test model 2 for multi_simulate_bulk_deletion."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for MultiDeleteModel2."""
+
+        app_label = "test_multi_delete_2"
+
+    def __str__(self) -> str:
+        """String representation of MultiDeleteModel2."""
+        return self.name
+
+
+class CopyDbDefaultTestModel(models.Model):
+    """Test model with a db_default for can_bulk_create_with_copy."""
+
+    name: models.CharField[str, str] = models.CharField(
+        max_length=100, db_default="default"
+    )
+
+    class Meta:
+        """Meta class for CopyDbDefaultTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of CopyDbDefaultTestModel."""
+        return self.name
+
+
+def test_get_standard_db_batch_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test func for get_standard_db_batch_size."""
+    monkeypatch.delenv("WINIDJANGO_BULK_BATCH_SIZE", raising=False)
+    default_batch_size = 500
+    assert_with_msg(
+        get_standard_db_batch_size() == default_batch_size,
+        f"Expected the default of {default_batch_size} without the env variable",
+    )
+
+    custom_batch_size = 250
+    monkeypatch.setenv("WINIDJANGO_BULK_BATCH_SIZE", str(custom_batch_size))
+    batch_size = get_standard_db_batch_size()
+    assert_with_msg(
+        batch_size == custom_batch_size,
+        f"Expected {custom_batch_size} from the env variable, got {batch_size}",
+    )
+
+    for invalid_value in ["abc", "0", "-5", ""]:
+        monkeypatch.setenv("WINIDJANGO_BULK_BATCH_SIZE", invalid_value)
+        with pytest.raises(ValueError, match="WINIDJANGO_BULK_BATCH_SIZE"):
+            get_standard_db_batch_size()
+
+
 @pytest.mark.django_db
 def test_bulk_create_in_steps() -> None:
     """Test func for bulk_create_in_steps."""
@@ -66,6 +237,18 @@ def test_bulk_update_in_steps() -> None:
         f"Expected {len(created)} updated, got {updated}",
     )
 
+    # a streamed queryset is updated chunk by chunk without building a list
+    updated = bulk_update_in_steps(
+        ModelA,
+        ModelA.objects.iterator(chunk_size=5),
+        ["int_field"],
+        step=3,
+    )
+    assert_with_msg(
+        updated == len(created),
+        f"Expected {len(created)} updated, got {updated}",
+    )
+
 
 @pytest.mark.django_db
 def test_bulk_delete_in_steps() -> None:
@@ -79,9 +262,18 @@ def test_bulk_delete_in_steps() -> None:
         f"Expected {len(created)} deleted, got {deleted[0]}",
     )
 
+    # a streamed queryset is deleted chunk by chunk
+    bulk = [ModelA(str_field=f"test_{i}", int_field=i) for i in range(1, 11)]
+    created = bulk_create_in_steps(ModelA, bulk, step=5)
+    deleted = bulk_delete_in_steps(ModelA, ModelA.objects.iterator(), step=3)
+    assert_with_msg(
+        deleted[0] == len(created),
+        f"Expected {len(created)} deleted, got {deleted[0]}",
+    )
+
 
 @pytest.mark.django_db
-def test_bulk_method_in_steps() -> None:
+def test_bulk_method_in_steps(mocker: MockerFixture) -> None:
     """Test func for bulk_method_in_steps."""
     # create some test data
     bulk = [ModelA(str_field=f"test_{i}", int_field=i) for i in range(1, 11)]
@@ -97,9 +289,21 @@ def test_bulk_method_in_steps() -> None:
         f"Expected {len(created)} deleted, got {deleted[0]}",
     )
 
+    # empty bulks return the empty result without opening a transaction
+    atomic_mock = mocker.patch(make_obj_importpath(bulk_method_in_steps_atomic))
+    empty_results: list[Any] = [
+        bulk_method_in_steps(ModelA, [], step=5, mode=mode)
+        for mode in (MODE_CREATE, MODE_UPDATE, MODE_DELETE)
+    ]
+    assert_with_msg(
+        empty_results == [[], 0, (0, {})],
+        f"Expected [[], 0, (0, {{}})], got {empty_results}",
+    )
+    atomic_mock.assert_not_called()
+
 
 @pytest.mark.django_db
-def test_bulk_method_in_steps_atomic() -> None:
+def test_bulk_method_in_steps_atomic(mocker: MockerFixture) -> None:
     """Test func for bulk_method_in_steps_atomic."""
     # create some test data
     bulk = [ModelA(str_field=f"test_{i}", int_field=i) for i in range(1, 11)]
@@ -116,6 +320,21 @@ def test_bulk_method_in_steps_atomic() -> None:
         f"Expected {len(created)} deleted, got {deleted[0]}",
     )
 
+    # every chunk runs on this thread inside the transaction of the call
+    chunk_threads: list[tuple[int, bool]] = []
+
+    def record_chunk(chunk: list[models.Model]) -> list[models.Model]:
+        chunk_threads.append((threading.get_ident(), connection.in_atomic_block))
+        return chunk
+
+    mocker.patch(make_obj_importpath(get_bulk_method), return_value=record_chunk)
+    bulk_method_in_steps_atomic(ModelA, bulk, step=3, mode=MODE_CREATE)
+    expected_chunk_threads = [(threading.get_ident(), True)] * 4
+    assert_with_msg(
+        chunk_threads == expected_chunk_threads,
+        f"Expected all chunks on this thread in a transaction, got {chunk_threads}",
+    )
+
 
 def test_get_step_chunks() -> None:
     """Test func for get_step_chunks."""
@@ -149,24 +368,26 @@ def test_get_step_chunks() -> None:
         f"Expected {expected_large_chunks}, got {large_chunks}",
     )
 
+    # Test that iterators are consumed lazily, one chunk at a time
+    bulk_iter = iter(large_bulk)
+    lazy_chunks = get_step_chunks(bulk_iter, 3)
+    first_chunk = next(lazy_chunks)
+    assert_with_msg(
+        first_chunk == (large_bulk[:3],),
+        f"Expected {(large_bulk[:3],)}, got {first_chunk}",
+    )
+    assert_with_msg(
+        next(bulk_iter) is large_bulk[3],
+        "Expected only the first chunk to be consumed from the iterator",
+    )
 
-def test_get_bulk_method() -> None:
-    """Test func for get_bulk_method."""
-
-    # Create test model
-    class BulkMethodTestModel(models.Model):
-        """Test model for get_bulk_method."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_get_bulk_method"
-
-        def __str__(self) -> str:
-            return self.name
 
+def test_get_bulk_method(mocker: MockerFixture) -> None:
+    """Test func for get_bulk_method."""
     # Test create method
-    create_method = get_bulk_method(BulkMethodTestModel, MODE_CREATE)
+    create_method: Callable[[list[models.Model]], Any] = get_bulk_method(
+        BulkMethodTestModel, MODE_CREATE
+    )
     assert_with_msg(
         callable(create_method),
         "Expected create method to be callable",
@@ -186,22 +407,30 @@ def test_get_bulk_method() -> None:
         "Expected delete method to be callable",
     )
 
+    # Test that create and update pass a db batch size to django
+    mock_bulk_create = mocker.patch.object(BulkMethodTestModel.objects, "bulk_create")
+    create_method([])
+    create_batch_size = mock_bulk_create.call_args.kwargs["batch_size"]
+    assert_with_msg(
+        create_batch_size == STANDARD_DB_BATCH_SIZE,
+        f"Expected batch_size {STANDARD_DB_BATCH_SIZE}, got {create_batch_size}",
+    )
 
-def test_flatten_bulk_in_steps_result() -> None:
-    """Test func for flatten_bulk_in_steps_result."""
-
-    # Create test model for results
-    class FlattenTestModel(models.Model):
-        """Test model for flatten_bulk_in_steps_result."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_flatten"
+    mock_bulk_update = mocker.patch.object(BulkMethodTestModel.objects, "bulk_update")
+    custom_batch_size = 10
+    batched_update_method: Callable[[list[models.Model]], Any] = get_bulk_method(
+        BulkMethodTestModel, MODE_UPDATE, fields=["name"], batch_size=custom_batch_size
+    )
+    batched_update_method([])
+    update_batch_size = mock_bulk_update.call_args.kwargs["batch_size"]
+    assert_with_msg(
+        update_batch_size == custom_batch_size,
+        f"Expected batch_size {custom_batch_size}, got {update_batch_size}",
+    )
 
-        def __str__(self) -> str:
-            return self.name
 
+def test_flatten_bulk_in_steps_result() -> None:
+    """Test func for flatten_bulk_in_steps_result."""
     # Test create mode flattening
     test_instances = [FlattenTestModel(name=f"test_{i}") for i in range(3)]
     create_results = [test_instances[:2], test_instances[2:]]
@@ -246,46 +475,355 @@ def test_flatten_bulk_in_steps_result() -> None:
     )
 
 
-def test_bulk_delete() -> None:
+def test_bulk_delete(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test func for bulk_delete."""
+    test_instances = [BulkDeleteTestModel(pk=i, name=f"test_{i}") for i in range(1, 4)]
 
-    # Create test model
-    class BulkDeleteTestModel(models.Model):
-        """Test model for bulk_delete."""
+    # Mock the model's objects manager
+    pk_chunks: list[list[int]] = []
 
-        name: models.CharField[str, str] = models.CharField(max_length=100)
+    class MockQuerySet:
+        def __init__(self, pks: list[int]) -> None:
+            self.pks = pks
 
-        class Meta:
-            app_label = "test_bulk_delete"
+        def delete(self) -> tuple[int, dict[str, int]]:
+            return (len(self.pks), {"BulkDeleteTestModel": len(self.pks)})
 
-        def __str__(self) -> str:
-            return self.name
+    def mock_filter(**kwargs: Any) -> MockQuerySet:
+        pk_chunks.append(kwargs["pk__in"])
+        return MockQuerySet(kwargs["pk__in"])
 
-    # Test with non-empty list (empty list has a bug in the actual function)
-    test_instances = [BulkDeleteTestModel(pk=i, name=f"test_{i}") for i in range(1, 4)]
+    monkeypatch.setattr(BulkDeleteTestModel.objects, "filter", mock_filter)
 
-    # Mock the model's objects manager
-    with pytest.MonkeyPatch().context() as m:
+    # an empty bulk deletes nothing without a query
+    empty_result = bulk_delete(BulkDeleteTestModel, [])
+    assert_with_msg(
+        empty_result == (0, {}) and pk_chunks == [],
+        f"Expected (0, {{}}) without a query, got {empty_result} after {pk_chunks}",
+    )
 
-        class MockQuerySet:
-            def delete(self) -> tuple[int, dict[str, int]]:
-                return (3, {"BulkDeleteTestModel": 3})
+    result = bulk_delete(BulkDeleteTestModel, test_instances)
 
-        def mock_filter(**kwargs: Any) -> MockQuerySet:  # noqa: ARG001
-            return MockQuerySet()
+    assert_with_msg(
+        result == (3, {"BulkDeleteTestModel": 3}),
+        f"Expected (3, {{'BulkDeleteTestModel': 3}}), got {result}",
+    )
 
-        m.setattr(BulkDeleteTestModel.objects, "filter", mock_filter)
+    # the pks are split into one delete query per batch
+    pk_chunks.clear()
+    result = bulk_delete(BulkDeleteTestModel, iter(test_instances), batch_size=2)
+    assert_with_msg(
+        pk_chunks == [[1, 2], [3]],
+        f"Expected pk chunks [[1, 2], [3]], got {pk_chunks}",
+    )
+    assert_with_msg(
+        result == (3, {"BulkDeleteTestModel": 3}),
+        f"Expected (3, {{'BulkDeleteTestModel': 3}}), got {result}",
+    )
 
-        result = bulk_delete(BulkDeleteTestModel, test_instances)
+    # a batch size below 1 is rejected instead of silently deleting nothing
+    pk_chunks.clear()
+    with pytest.raises(ValueError, match="positive integer"):
+        bulk_delete(BulkDeleteTestModel, test_instances, batch_size=0)
+    assert_with_msg(
+        pk_chunks == [],
+        f"Expected no delete query for an invalid batch size, got {pk_chunks}",
+    )
 
-        assert_with_msg(
-            result == (3, {"BulkDeleteTestModel": 3}),
-            f"Expected (3, {{'BulkDeleteTestModel': 3}}), got {result}",
-        )
+
+def test_can_bulk_create_with_copy(mocker: MockerFixture) -> None:
+    """Test func for can_bulk_create_with_copy."""
+    bulk_with_pks = [ModelA(pk=i, str_field=f"test_{i}", int_field=i) for i in [1, 2]]
+    # copy is never possible on other databases than postgres
+    sqlite_connection = mocker.MagicMock(vendor="sqlite")
+    mocker.patch.object(bulk, "connections", {"default": sqlite_connection})
+    assert_with_msg(
+        not can_bulk_create_with_copy(ModelA, bulk_with_pks),
+        "Expected copy to be impossible on sqlite",
+    )
+
+    # pretend to be on postgres with psycopg 3
+    postgres_connection = mocker.MagicMock(vendor="postgresql")
+    mocker.patch.object(bulk, "connections", {"default": postgres_connection})
+    mocker.patch.dict(
+        sys.modules,
+        {
+            "django.db.backends.postgresql.psycopg_any": mocker.MagicMock(
+                is_psycopg3=True
+            )
+        },
+    )
+    assert_with_msg(
+        can_bulk_create_with_copy(ModelA, bulk_with_pks, batch_size=10),
+        "Expected copy to be possible for objects with pks",
+    )
+    bulk_without_pks = [ModelA(str_field="test", int_field=1)]
+    assert_with_msg(
+        not can_bulk_create_with_copy(ModelA, bulk_without_pks),
+        "Expected copy to be impossible for objects without pks",
+    )
+    assert_with_msg(
+        not can_bulk_create_with_copy(ModelA, bulk_with_pks, ignore_conflicts=True),
+        "Expected copy to be impossible with conflict handling",
+    )
+    assert_with_msg(
+        not can_bulk_create_with_copy(ModelA, []),
+        "Expected copy to be impossible for an empty bulk",
+    )
+    bulk_with_expression = [ModelA(pk=1, str_field="test", int_field=Value(1))]
+    assert_with_msg(
+        not can_bulk_create_with_copy(ModelA, bulk_with_expression),
+        "Expected copy to be impossible for objects holding expressions",
+    )
+    bulk_with_db_default = [CopyDbDefaultTestModel(pk=1)]
+    assert_with_msg(
+        not can_bulk_create_with_copy(CopyDbDefaultTestModel, bulk_with_db_default),
+        "Expected copy to be impossible for unset db_default fields",
+    )
+    bulk_with_value = [CopyDbDefaultTestModel(pk=1, name="set")]
+    assert_with_msg(
+        can_bulk_create_with_copy(CopyDbDefaultTestModel, bulk_with_value),
+        "Expected copy to be possible for set db_default fields",
+    )
+
+
+def test_bulk_create_with_copy(mocker: MockerFixture) -> None:
+    """Test func for bulk_create_with_copy."""
+    postgres_connection = mocker.MagicMock(vendor="postgresql", alias="default")
+    postgres_connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+    mocker.patch.object(bulk, "connections", {"default": postgres_connection})
+    cursor = postgres_connection.cursor.return_value.__enter__.return_value
+    copy = cursor.copy.return_value.__enter__.return_value
+
+    model_a = ModelA(pk=1, str_field="test", int_field=1)
+    # assigned before model_a has its pk, like in bulk_create_bulks_in_steps
+    model_b = ModelB(model_a=ModelA(str_field="test", int_field=2))
+    model_b.model_a.pk = 2
+    model_b.pk = 1
+
+    created = bulk_create_with_copy(ModelB, [model_b])
+    sql = cursor.copy.call_args.args[0]
+    expected_sql = (
+        'COPY "tests_modelb" ("id", "created_at", "updated_at", "model_a_id") '
+        "FROM STDIN"
+    )
+    assert_with_msg(
+        sql == expected_sql,
+        f"Expected {expected_sql}, got {sql}",
+    )
+    assert_with_msg(
+        created == [model_b] and copy.write_row.call_count == 1,
+        f"Expected one row to be copied, got {copy.write_row.call_count}",
+    )
+    assert_with_msg(
+        model_b.serializable_value("model_a") == model_b.model_a.pk,
+        "Expected the fk id to be taken from the related object",
+    )
+    assert_with_msg(
+        not model_b._state.adding and model_a._state.adding,  # noqa: SLF001
+        "Expected only the copied object to be marked as saved",
+    )
+
+
+def test_can_bulk_update_with_values(mocker: MockerFixture) -> None:
+    """Test func for can_bulk_update_with_values."""
+    bulk_with_pks = [ModelA(pk=i, str_field=f"test_{i}", int_field=i) for i in [1, 2]]
+    # values updates are never possible on other databases than postgres
+    sqlite_connection = mocker.MagicMock(vendor="sqlite")
+    mocker.patch.object(bulk, "connections", {"default": sqlite_connection})
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_with_pks, ["int_field"]),
+        "Expected values update to be impossible on sqlite",
+    )
+
+    # pretend to be on postgres
+    postgres_connection = mocker.MagicMock(vendor="postgresql")
+    mocker.patch.object(bulk, "connections", {"default": postgres_connection})
+    assert_with_msg(
+        can_bulk_update_with_values(
+            ModelA, bulk_with_pks, ["str_field", "int_field"], batch_size=10
+        ),
+        "Expected values update to be possible for objects with pks",
+    )
+    bulk_without_pks = [ModelA(str_field="test", int_field=1)]
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_without_pks, ["int_field"]),
+        "Expected values update to be impossible for objects without pks",
+    )
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_with_pks, ["id"]),
+        "Expected values update to be impossible for the pk field",
+    )
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_with_pks, ["missing"]),
+        "Expected values update to be impossible for unknown fields",
+    )
+    bulk_with_duplicates = [ModelA(pk=1, str_field="test", int_field=i) for i in [1, 2]]
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_with_duplicates, ["int_field"]),
+        "Expected update from values to be impossible for duplicate pks",
+    )
+    bulk_with_expression = [ModelA(pk=1, str_field="test", int_field=F("int_field"))]
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, bulk_with_expression, ["int_field"]),
+        "Expected values update to be impossible for expressions",
+    )
+    assert_with_msg(
+        not can_bulk_update_with_values(ModelA, [], ["int_field"]),
+        "Expected values update to be impossible for an empty bulk",
+    )
+    assert_with_msg(
+        can_bulk_update_with_values(
+            ModelA, bulk_with_pks, ["int_field"], batch_size=None
+        ),
+        "Expected values update to be possible without a batch size",
+    )
+    assert_with_msg(
+        not can_bulk_update_with_values(
+            ModelA, bulk_with_pks, ["int_field"], batch_size=0
+        ),
+        "Expected bulk_update to handle a batch size that is not positive",
+    )
+
+
+def test_bulk_update_with_values(mocker: MockerFixture) -> None:
+    """Test func for bulk_update_with_values."""
+    postgres_connection = mocker.MagicMock(vendor="postgresql", alias="default")
+    postgres_connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+    mocker.patch.object(bulk, "connections", {"default": postgres_connection})
+    mocker.patch("django.db.transaction.atomic")
+    # the connection prepares values like the real postgres backend
+    postgres_connection.ops.validate_autopk_value.side_effect = lambda value: value
+    postgres_connection.ops.adapt_integerfield_value.side_effect = (
+        lambda value, _internal_type: value
+    )
+    # the column types of the postgres backend, which needs psycopg to import
+    postgres_connection.data_types = {
+        "AutoField": "integer",
+        "CharField": "varchar(%(max_length)s)",
+        "IntegerField": "integer",
+    }
+    cursor = postgres_connection.cursor.return_value.__enter__.return_value
+    cursor.rowcount = 2
+
+    bulk_a = [ModelA(pk=i, str_field=f"test_{i}", int_field=i) for i in range(1, 4)]
+    updated = bulk_update_with_values(ModelA, bulk_a, ["int_field"], batch_size=2)
+
+    # one statement per batch
+    expected_statements = 2
+    expected_updated = cursor.rowcount * expected_statements
+    assert_with_msg(
+        cursor.execute.call_count == expected_statements
+        and updated == expected_updated,
+        f"Expected {expected_statements} statements and {expected_updated} "
+        f"updated rows, got {cursor.execute.call_count} and {updated}",
+    )
+    sql, params = cursor.execute.call_args_list[0].args
+    expected_sql = (
+        'UPDATE "tests_modela" SET "int_field" = v."int_field" '
+        "FROM (VALUES (%s::integer, %s::integer), (%s::integer, %s::integer)) "
+        'AS v ("id", "int_field") '
+        'WHERE "tests_modela"."id" = v."id"'
+    )
+    assert_with_msg(
+        sql == expected_sql,
+        f"Expected {expected_sql}, got {sql}",
+    )
+    assert_with_msg(
+        params == [1, 1, 2, 2],
+        f"Expected the pks and values as params, got {params}",
+    )
+
+    # the casts follow the column types, also for parametrized ones
+    cursor.reset_mock()
+    bulk_update_with_values(ModelA, bulk_a[:1], ["str_field"])
+    sql = cursor.execute.call_args.args[0]
+    assert_with_msg(
+        "(VALUES (%s::integer, %s::varchar(100)))" in sql,
+        f"Expected the pk and varchar casts, got {sql}",
+    )
+
+    # a field given twice or by name and attname is assigned once
+    cursor.reset_mock()
+    model_b = ModelB(pk=1, model_a=bulk_a[0])
+    bulk_update_with_values(ModelB, [model_b], ["model_a", "model_a_id", "model_a"])
+    sql, params = cursor.execute.call_args.args
+    expected_sql = (
+        'UPDATE "tests_modelb" SET "model_a_id" = v."model_a_id" '
+        "FROM (VALUES (%s::integer, %s::integer)) "
+        'AS v ("id", "model_a_id") '
+        'WHERE "tests_modelb"."id" = v."id"'
+    )
+    assert_with_msg(
+        sql == expected_sql and params == [1, 1],
+        f"Expected {expected_sql} with [1, 1], got {sql} with {params}",
+    )
+
+    # without a batch size all objects go in one statement
+    cursor.reset_mock()
+    bulk_update_with_values(ModelA, bulk_a, ["int_field"], batch_size=None)
+    assert_with_msg(
+        cursor.execute.call_count == 1,
+        f"Expected a single statement, got {cursor.execute.call_count}",
+    )
 
 
 @pytest.mark.django_db
-def test_bulk_create_bulks_in_steps() -> None:
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="COPY and UPDATE FROM VALUES are only used on postgres",
+)
+def test_bulk_create_with_copy_and_update_with_values_on_postgres() -> None:
+    """Test the postgres only COPY and UPDATE FROM VALUES paths on real rows."""
+    bulk_a = [ModelA(pk=i, str_field=f"test_{i}", int_field=i) for i in range(1, 4)]
+    bulk_b = [ModelB(pk=i, model_a=bulk_a[0]) for i in range(1, 4)]
+    assert_with_msg(
+        can_bulk_create_with_copy(ModelA, bulk_a)
+        and can_bulk_create_with_copy(ModelB, bulk_b),
+        "Expected copy to be possible on postgres",
+    )
+    bulk_create_with_copy(ModelA, bulk_a)
+    bulk_create_with_copy(ModelB, bulk_b)
+    rows_a = list(
+        ModelA.objects.order_by("pk").values_list("pk", "str_field", "int_field")
+    )
+    expected_rows_a = [(i, f"test_{i}", i) for i in range(1, 4)]
+    assert_with_msg(
+        rows_a == expected_rows_a,
+        f"Expected {expected_rows_a} to be copied, got {rows_a}",
+    )
+
+    for model_a in bulk_a:
+        model_a.str_field = f"updated_{model_a.pk}"
+        model_a.int_field = model_a.pk * 10
+    update_fields = ["str_field", "int_field", "int_field"]
+    assert_with_msg(
+        can_bulk_update_with_values(ModelA, bulk_a, update_fields),
+        "Expected values update to be possible on postgres",
+    )
+    updated = bulk_update_with_values(ModelA, bulk_a, update_fields, batch_size=2)
+    rows_a = list(
+        ModelA.objects.order_by("pk").values_list("pk", "str_field", "int_field")
+    )
+    expected_rows_a = [(i, f"updated_{i}", i * 10) for i in range(1, 4)]
+    assert_with_msg(
+        updated == len(bulk_a) and rows_a == expected_rows_a,
+        f"Expected {expected_rows_a} to be updated, got {updated} rows {rows_a}",
+    )
+
+    # foreign keys by name and attname, all in one statement
+    for model_b in bulk_b:
+        model_b.model_a = bulk_a[-1]
+    bulk_update_with_values(ModelB, bulk_b, ["model_a", "model_a_id"], batch_size=None)
+    model_a_ids = set(ModelB.objects.values_list("model_a_id", flat=True))
+    assert_with_msg(
+        model_a_ids == {bulk_a[-1].pk},
+        f"Expected all ModelB rows to point to {bulk_a[-1].pk}, got {model_a_ids}",
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_create_bulks_in_steps(mocker: MockerFixture) -> None:
     """Test func for bulk_create_bulks_in_steps."""
     # bulk a
     bulk_a = [ModelA(str_field=f"test_{i}", int_field=i) for i in range(1, 11)]
@@ -299,6 +837,12 @@ def test_bulk_create_bulks_in_steps() -> None:
         results == bulk_by_class,
         f"Expected {bulk_by_class}, got {results}",
     )
+
+    empty_results: dict[type[Model], list[Model]] = bulk_create_bulks_in_steps({})
+    assert_with_msg(
+        empty_results == {},
+        f"Expected empty results for no bulks, got {empty_results}",
+    )
     results_b: list[ModelB] = cast("list[ModelB]", (results[ModelB]))
     # assert b has as with pks after
     for model_b in results_b:
@@ -307,23 +851,22 @@ def test_bulk_create_bulks_in_steps() -> None:
             f"Expected pk for {model_b}, got None",
         )
 
+    # a failing dependent bulk rolls back the bulks created before it
+    mocker.patch.object(ModelB.objects, "bulk_create", side_effect=RuntimeError)
+    failing_bulk_by_class: dict[type[Model], Iterable[Model]] = {
+        ModelA: [ModelA(str_field="rolled_back", int_field=0)],
+        ModelB: [ModelB()],
+    }
+    with pytest.raises(RuntimeError):
+        bulk_create_bulks_in_steps(failing_bulk_by_class)
+    assert_with_msg(
+        not ModelA.objects.filter(str_field="rolled_back").exists(),
+        "Expected the ModelA bulk to be rolled back",
+    )
+
 
 def test_get_differences_between_bulks() -> None:
     """Test func for get_differences_between_bulks."""
-
-    # Create test model
-    class DiffTestModel(models.Model):
-        """Test model for get_differences_between_bulks."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-        value: models.IntegerField[int, int] = models.IntegerField()
-
-        class Meta:
-            app_label = "test_differences"
-
-        def __str__(self) -> str:
-            return self.name
-
     # Test with empty bulks
     empty_result = get_differences_between_bulks([], [], [])
     assert_with_msg(
@@ -363,38 +906,14 @@ def test_get_differences_between_bulks() -> None:
     )
 
     # Test with different model types raises ValueError
-    class OtherModel(models.Model):
-        """Other test model."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_differences_other"
-
-        def __str__(self) -> str:
-            return self.name
-
     other_bulk = [OtherModel(name="other")]
 
     with pytest.raises(ValueError, match="Both bulks must be of the same model type"):
         get_differences_between_bulks(bulk1, other_bulk, fields)  # type: ignore[arg-type]
 
 
-def test_simulate_bulk_deletion() -> None:
+def test_simulate_bulk_deletion(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test func for simulate_bulk_deletion."""
-
-    # Create test model
-    class SimulateDeleteTestModel(models.Model):
-        """Test model for simulate_bulk_deletion."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_simulate_delete"
-
-        def __str__(self) -> str:
-            return self.name
-
     # Test with empty entries
     empty_result = simulate_bulk_deletion(SimulateDeleteTestModel, [])
     assert_with_msg(
@@ -408,61 +927,36 @@ def test_simulate_bulk_deletion() -> None:
     ]
 
     # Mock the Collector to avoid actual database operations
-    with pytest.MonkeyPatch().context() as m:
-
-        class MockCollector:
-            def __init__(self, *_args: Any, **_kwargs: Any) -> None:
-                self.data: defaultdict[type[models.Model], set[models.Model]] = (
-                    defaultdict(set)
-                )
-                self.fast_deletes: list[Any] = []
+    class MockCollector:
+        def __init__(self, *_args: Any, **_kwargs: Any) -> None:
+            self.data: defaultdict[type[models.Model], set[models.Model]] = defaultdict(
+                set
+            )
+            self.fast_deletes: list[Any] = []
 
-            def collect(self, entries: list[models.Model]) -> None:
-                # Simulate collecting the entries
-                for entry in entries:
-                    self.data[entry.__class__].add(entry)
+        def collect(self, entries: list[models.Model]) -> None:
+            # Simulate collecting the entries
+            for entry in entries:
+                self.data[entry.__class__].add(entry)
 
-        m.setattr(make_obj_importpath(bulk) + ".Collector", MockCollector)
+    monkeypatch.setattr(make_obj_importpath(bulk) + ".Collector", MockCollector)
 
-        result = simulate_bulk_deletion(SimulateDeleteTestModel, test_instances)
+    result = simulate_bulk_deletion(SimulateDeleteTestModel, test_instances)
 
-        assert_with_msg(
-            SimulateDeleteTestModel in result,
-            "Expected SimulateDeleteTestModel in result",
-        )
-        assert_with_msg(
-            len(result[SimulateDeleteTestModel]) == len(test_instances),
-            f"Expected {len(test_instances)} instances, "
-            f"got {len(result[SimulateDeleteTestModel])}",
-        )
+    assert_with_msg(
+        SimulateDeleteTestModel in result,
+        "Expected SimulateDeleteTestModel in result",
+    )
+    assert_with_msg(
+        len(result[SimulateDeleteTestModel]) == len(test_instances),
+        f"Expected {len(test_instances)} instances, "
+        f"got {len(result[SimulateDeleteTestModel])}",
+    )
 
 
-def test_multi_simulate_bulk_deletion() -> None:
+@pytest.mark.django_db
+def test_multi_simulate_bulk_deletion(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test func for multi_simulate_bulk_deletion."""
-
-    # Create test models
-    class MultiDeleteModel1(models.Model):
-        """Test model 1 for multi_simulate_bulk_deletion."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_multi_delete_1"
-
-        def __str__(self) -> str:
-            return self.name
-
-    class MultiDeleteModel2(models.Model):
-        """Test model 2 for multi_simulate_bulk_deletion."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-
-        class Meta:
-            app_label = "test_multi_delete_2"
-
-        def __str__(self) -> str:
-            return self.name
-
     # Test with empty entries
     empty_result = multi_simulate_bulk_deletion({})
     assert_with_msg(
@@ -470,44 +964,52 @@ def test_multi_simulate_bulk_deletion() -> None:
         "Expected empty result for empty entries",
     )
 
+    # real rows of the open test transaction are seen by every simulation
+    model_a = ModelA.objects.create(str_field="a", int_field=1)
+    model_b = ModelB.objects.create(model_a=model_a)
+    db_result = multi_simulate_bulk_deletion({ModelA: [model_a], ModelB: [model_b]})
+    db_counts = {model: len(objs) for model, objs in db_result.items() if objs}
+    assert_with_msg(
+        db_counts == {ModelA: 1, ModelB: 1},
+        f"Expected {{ModelA: 1, ModelB: 1}}, got {db_counts}",
+    )
+
     # Mock the simulate_bulk_deletion function
-    with pytest.MonkeyPatch().context() as m:
-
-        def mock_simulate_bulk_deletion(
-            model_class: type[models.Model], entries: list[models.Model]
-        ) -> dict[type[models.Model], set[models.Model]]:
-            # Return a mock result - use list instead of set to avoid hashing issues
-            return {
-                model_class: set(entries[:1])
-            }  # Only take first item to avoid hashing issues
-
-        m.setattr(
-            make_obj_importpath(simulate_bulk_deletion),
-            mock_simulate_bulk_deletion,
-        )
+    def mock_simulate_bulk_deletion(
+        model_class: type[models.Model], entries: list[models.Model]
+    ) -> dict[type[models.Model], set[models.Model]]:
+        # Return a mock result - use list instead of set to avoid hashing issues
+        return {
+            model_class: set(entries[:1])
+        }  # Only take first item to avoid hashing issues
+
+    monkeypatch.setattr(
+        make_obj_importpath(simulate_bulk_deletion),
+        mock_simulate_bulk_deletion,
+    )
 
-        # Test with multiple model types -
-        # use instances with PKs to avoid hashing issues
-        model1_instances: list[models.Model] = [
-            MultiDeleteModel1(pk=i, name=f"model1_{i}") for i in range(1, 3)
-        ]
-        model2_instances: list[models.Model] = [
-            MultiDeleteModel2(pk=i, name=f"model2_{i}") for i in range(1, 4)
-        ]
+    # Test with multiple model types -
+    # use instances with PKs to avoid hashing issues
+    model1_instances: list[models.Model] = [
+        MultiDeleteModel1(pk=i, name=f"model1_{i}") for i in range(1, 3)
+    ]
+    model2_instances: list[models.Model] = [
+        MultiDeleteModel2(pk=i, name=f"model2_{i}") for i in range(1, 4)
+    ]
 
-        entries: dict[type[models.Model], list[models.Model]] = {
-            MultiDeleteModel1: model1_instances,
-            MultiDeleteModel2: model2_instances,
-        }
+    entries: dict[type[models.Model], list[models.Model]] = {
+        MultiDeleteModel1: model1_instances,
+        MultiDeleteModel2: model2_instances,
+    }
 
-        result = multi_simulate_bulk_deletion(entries)
+    result = multi_simulate_bulk_deletion(entries)
 
-        assert_with_msg(
-            result
-            == {
-                MultiDeleteModel1: set(model1_instances[:1]),
-                MultiDeleteModel2: set(model2_instances[:1]),
-            },
-            f"Expected {{MultiDeleteModel1: {model1_instances[:1]}, "
-            f"MultiDeleteModel2: {model2_instances[:1]}}}, got {result}",
-        )
+    assert_with_msg(
+        result
+        == {
+            MultiDeleteModel1: set(model1_instances[:1]),
+            MultiDeleteModel2: set(model2_instances[:1]),
+        },
+        f"Expected {{MultiDeleteModel1: {model1_instances[:1]}, "
+        f"MultiDeleteModel2: {model2_instances[:1]}}}, got {result}",
+    )
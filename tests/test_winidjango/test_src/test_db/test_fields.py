@@ -23,21 +23,55 @@ class CustomContentType(models.Model):
         return f"{self.app_label}.{self.model}"
 
 
-def test_get_model_meta() -> None:
-    """Test func for get_model_meta."""
+class MetaTestModel(models.Model):
+    """Test model for get_model_meta."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+
+    class Meta:
+        """Meta class for MetaTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of MetaTestModel."""
+        return self.name
 
-    # Create a test model since Django auth models aren't available
-    class MetaTestModel(models.Model):
-        """Test model for get_model_meta."""
 
-        name: models.CharField[str, str] = models.CharField(max_length=100)
+class FieldsTestModel(models.Model):
+    """Test model for get_fields."""
 
-        class Meta:
-            app_label = "test_app"
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
 
-        def __str__(self) -> str:
-            return self.name
+    class Meta:
+        """Meta class for FieldsTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of FieldsTestModel."""
+        return self.name
 
+
+class FieldNamesTestModel(models.Model):
+    """Test model for get_field_names."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta:
+        """Meta class for FieldNamesTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of FieldNamesTestModel."""
+        return self.name
+
+
+def test_get_model_meta() -> None:
+    """Test func for get_model_meta."""
     # Test that get_model_meta returns the _meta attribute
     meta = get_model_meta(MetaTestModel)
     assert_with_msg(
@@ -80,18 +114,6 @@ def test_get_model_meta() -> None:
 
 def test_get_fields() -> None:
     """Test func for get_fields."""
-
-    # Create test models for testing
-    class FieldsTestModel(models.Model):
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-        value: models.IntegerField[int, int] = models.IntegerField()
-
-        class Meta:
-            app_label = "test_app"
-
-        def __str__(self) -> str:
-            return self.name
-
     # Test with our test model
     fields = get_fields(FieldsTestModel)
 
@@ -134,20 +156,6 @@ def test_get_fields() -> None:
 
 def test_get_field_names() -> None:
     """Test func for get_field_names."""
-
-    # Create test model for testing
-    class FieldNamesTestModel(models.Model):
-        """Test model for get_field_names."""
-
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-        value: models.IntegerField[int, int] = models.IntegerField()
-
-        class Meta:
-            app_label = "test_app"
-
-        def __str__(self) -> str:
-            return self.name
-
     # Test with test model fields
     fields = get_fields(FieldNamesTestModel)
     field_names = get_field_names(fields)
@@ -1,73 +1,163 @@
 """Tests for winidjango.database module."""
 
 from django.db import models
+from pyrig.src.modules.module import make_obj_importpath
 from pyrig.src.testing.assertions import assert_with_msg
+from pytest_mock import MockerFixture
 
 from winidjango.src.db.fields import get_fields
 from winidjango.src.db.models import (
     BaseModel,
+    get_model_instance_hasher,
+    get_models_topological_sorter,
     hash_model_instance,
+    topological_layers,
     topological_sort_models,
 )
 
 
-def test_topological_sort_models() -> None:
-    """Test func for topological_sort_models."""
+class Author(models.Model):
+    """Test model for topological sorting."""
 
-    # Create test models with dependencies for testing
-    class Author(models.Model):
-        """Test model for topological sorting."""
+    name: models.CharField[str, str] = models.CharField(max_length=100)
 
-        name: models.CharField[str, str] = models.CharField(max_length=100)
+    class Meta:
+        """Meta class for Author."""
 
-        class Meta:
-            app_label = "test_app"
+        app_label = "test_app"
 
-        def __str__(self) -> str:
-            return self.name
+    def __str__(self) -> str:
+        """String representation of Author."""
+        return self.name
 
-    class Publisher(models.Model):
-        """Test model for topological sorting."""
 
-        name: models.CharField[str, str] = models.CharField(max_length=100)
+class Publisher(models.Model):
+    """Test model for topological sorting."""
 
-        class Meta:
-            app_label = "test_app"
+    name: models.CharField[str, str] = models.CharField(max_length=100)
 
-        def __str__(self) -> str:
-            return self.name
+    class Meta:
+        """Meta class for Publisher."""
 
-    class Book(models.Model):
-        """Test model for topological sorting."""
+        app_label = "test_app"
 
-        title: models.CharField[str, str] = models.CharField(max_length=200)
-        author: models.ForeignKey[Author, Author] = models.ForeignKey(
-            Author, on_delete=models.CASCADE
-        )
-        publisher: models.ForeignKey[Publisher, Publisher] = models.ForeignKey(
-            Publisher, on_delete=models.CASCADE
-        )
+    def __str__(self) -> str:
+        """String representation of Publisher."""
+        return self.name
 
-        class Meta:
-            app_label = "test_app"
 
-        def __str__(self) -> str:
-            return self.title
+class Book(models.Model):
+    """Test model for topological sorting."""
 
-    class Review(models.Model):
-        """Test model for topological sorting."""
+    title: models.CharField[str, str] = models.CharField(max_length=200)
+    author: models.ForeignKey[Author, Author] = models.ForeignKey(
+        Author, on_delete=models.CASCADE
+    )
+    publisher: models.ForeignKey[Publisher, Publisher] = models.ForeignKey(
+        Publisher, on_delete=models.CASCADE
+    )
 
-        book: models.ForeignKey[Book, Book] = models.ForeignKey(
-            Book, on_delete=models.CASCADE
-        )
-        rating: models.IntegerField[int, int] = models.IntegerField()
+    class Meta:
+        """Meta class for Book."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of Book."""
+        return self.title
+
+
+class Review(models.Model):
+    """Test model for topological sorting."""
+
+    book: models.ForeignKey[Book, Book] = models.ForeignKey(
+        Book, on_delete=models.CASCADE
+    )
+    rating: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta:
+        """Meta class for Review."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of Review."""
+        return f"Review of {self.book}"
+
+
+class HashTestModel(models.Model):
+    """Test model for hash_model_instance."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta:
+        """Meta class for HashTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of HashTestModel."""
+        return self.name
+
+
+class HasherTestModel(models.Model):
+    """Test model for get_model_instance_hasher."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+    note: models.CharField[str, str] = models.CharField(
+        max_length=100, editable=False, default=""
+    )
+
+    class Meta:
+        """Meta class for HasherTestModel."""
+
+        app_label = "test_app"
+
+    def __str__(self) -> str:
+        """String representation of HasherTestModel."""
+        return self.name
+
+
+class StrBaseModel(BaseModel):
+    """Test model for BaseModel.__str__."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta(BaseModel.Meta):
+        """Meta class for StrBaseModel."""
+
+        app_label = "test_app"
+
+
+class ReprBaseModel(BaseModel):
+    """Test model for BaseModel.__repr__."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
+
+    class Meta(BaseModel.Meta):
+        """Meta class for ReprBaseModel."""
+
+        app_label = "test_app"
+
+
+class MetaBaseModel(BaseModel):
+    """Test model for BaseModel.meta."""
+
+    name: models.CharField[str, str] = models.CharField(max_length=100)
+    value: models.IntegerField[int, int] = models.IntegerField()
 
-        class Meta:
-            app_label = "test_app"
+    class Meta(BaseModel.Meta):
+        """Meta class for MetaBaseModel."""
 
-        def __str__(self) -> str:
-            return f"Review of {self.book}"
+        app_label = "test_app"
 
+
+def test_topological_sort_models() -> None:
+    """Test func for topological_sort_models."""
     # Test basic topological sorting
     models_to_sort = [Review, Book, Author, Publisher]
     sorted_models = topological_sort_models(models_to_sort)
@@ -78,7 +168,7 @@ def test_topological_sort_models() -> None:
         f"Expected {len(models_to_sort)} models, got {len(sorted_models)}",
     )
     assert_with_msg(
-        set(sorted_models) == set(models_to_sort),
+        sorted(sorted_models, key=id) == sorted(models_to_sort, key=id),
         "Expected all input models to be in output",
     )
 
@@ -113,7 +203,7 @@ def test_topological_sort_models() -> None:
         f"Expected {expected_independent_count} independent models",
     )
     assert_with_msg(
-        set(sorted_independent) == set(independent_models),
+        sorted(sorted_independent, key=id) == sorted(independent_models, key=id),
         "Expected all independent models to be returned",
     )
 
@@ -132,22 +222,52 @@ def test_topological_sort_models() -> None:
     )
 
 
-def test_hash_model_instance() -> None:
-    """Test func for hash_model_instance."""
+def test_topological_layers() -> None:
+    """Test func for topological_layers."""
+    layers = topological_layers([Review, Book, Author, Publisher])
 
-    # Create a test model for hashing
-    class HashTestModel(models.Model):
-        """Test model for hash_model_instance."""
+    # each layer only depends on the ones before it
+    expected_layers = [{Author, Publisher}, {Book}, {Review}]
+    assert_with_msg(
+        [set(layer) for layer in layers] == expected_layers,
+        f"Expected layers {expected_layers}, got {layers}",
+    )
 
-        name: models.CharField[str, str] = models.CharField(max_length=100)
-        value: models.IntegerField[int, int] = models.IntegerField()
+    # models without dependencies between them form a single layer
+    independent_layers = topological_layers([Author, Publisher])
+    assert_with_msg(
+        len(independent_layers) == 1,
+        f"Expected a single layer, got {independent_layers}",
+    )
+
+    empty_layers: list[list[type[models.Model]]] = topological_layers([])
+    assert_with_msg(
+        empty_layers == [],
+        f"Expected no layers, got {empty_layers}",
+    )
 
-        class Meta:
-            app_label = "test_app"
 
-        def __str__(self) -> str:
-            return self.name
+def test_get_models_topological_sorter() -> None:
+    """Test func for get_models_topological_sorter."""
+    # Review is left out, so the reverse relation from Book to it is not added
+    ts = get_models_topological_sorter([Book, Author, Publisher])
+    ts.prepare()
 
+    ready = set(ts.get_ready())
+    assert_with_msg(
+        ready == {Author, Publisher},
+        f"Expected Author and Publisher to be ready first, got {ready}",
+    )
+    ts.done(*ready)
+    ready = set(ts.get_ready())
+    assert_with_msg(
+        ready == {Book},
+        f"Expected Book to be ready after its dependencies, got {ready}",
+    )
+
+
+def test_hash_model_instance(mocker: MockerFixture) -> None:
+    """Test func for hash_model_instance."""
     # Test hashing with saved instance (has pk)
     saved_instance = HashTestModel(pk=1, name="test", value=42)
     saved_fields = get_fields(HashTestModel)
@@ -159,6 +279,12 @@ def test_hash_model_instance() -> None:
         f"Expected hash to be int, got {type(saved_hash)}",
     )
 
+    # saved instances are hashed by pk without resolving the fields
+    hasher_mock = mocker.patch(make_obj_importpath(get_model_instance_hasher))
+    hash_model_instance(saved_instance, saved_fields)
+    hasher_mock.assert_not_called()
+    mocker.stop(hasher_mock)
+
     # Test that same pk produces same hash
     another_saved_instance = HashTestModel(pk=1, name="different", value=99)
     another_saved_hash = hash_model_instance(another_saved_instance, saved_fields)
@@ -220,23 +346,46 @@ def test_hash_model_instance() -> None:
     )
 
 
-class TestBaseModel:
-    """Test class for BaseModel."""
+def test_get_model_instance_hasher() -> None:
+    """Test func for get_model_instance_hasher."""
+    fields = get_fields(HasherTestModel)
+    hasher = get_model_instance_hasher(fields)
 
-    def test___str__(self) -> None:
-        """Test method for __str__."""
+    # the hasher gives the same hashes as hash_model_instance
+    instances = [
+        HasherTestModel(pk=1, name="test", value=42),
+        HasherTestModel(name="test", value=42),
+        HasherTestModel(name="different", value=42),
+    ]
+    for instance in instances:
+        assert_with_msg(
+            hasher(instance) == hash_model_instance(instance, fields),
+            f"Expected hasher to match hash_model_instance for {instance}",
+        )
 
-        class TestModel(BaseModel):
-            """Test model for __str__."""
+    # only the given fields are hashed
+    value_field = next(f for f in fields if f.name == "value")
+    value_hasher = get_model_instance_hasher([value_field])
+    assert_with_msg(
+        value_hasher(instances[1]) == value_hasher(instances[2]),
+        "Expected instances with the same value to have the same hash",
+    )
+
+    # like model_to_dict, fields that are not editable are not hashed
+    annotated_instance = HasherTestModel(name="test", value=42, note="note")
+    assert_with_msg(
+        hasher(annotated_instance) == hasher(instances[1]),
+        "Expected non editable fields to be ignored in the hash",
+    )
 
-            name: models.CharField[str, str] = models.CharField(max_length=100)
-            value: models.IntegerField[int, int] = models.IntegerField()
 
-            class Meta(BaseModel.Meta):
-                app_label = "test_app"
+class TestBaseModel:
+    """Test class for BaseModel."""
 
-        test_instance = TestModel(name="test", value=42)
-        expected = "TestModel(None)"
+    def test___str__(self) -> None:
+        """Test method for __str__."""
+        test_instance = StrBaseModel(name="test", value=42)
+        expected = "StrBaseModel(None)"
         assert_with_msg(
             str(test_instance) == expected,
             f"Expected '{expected}', got {test_instance}",
@@ -244,18 +393,8 @@ class TestBaseModel:
 
     def test___repr__(self) -> None:
         """Test method for __repr__."""
-
-        class TestModel2(BaseModel):
-            """Test model for __repr__."""
-
-            name: models.CharField[str, str] = models.CharField(max_length=100)
-            value: models.IntegerField[int, int] = models.IntegerField()
-
-            class Meta(BaseModel.Meta):
-                app_label = "test_app"
-
-        test_instance = TestModel2(name="test", value=42)
-        expected = "TestModel2(None)"
+        test_instance = ReprBaseModel(name="test", value=42)
+        expected = "ReprBaseModel(None)"
         assert_with_msg(
             repr(test_instance) == expected,
             f"Expected '{expected}', got {test_instance}",
@@ -263,17 +402,7 @@ class TestBaseModel:
 
     def test_meta(self) -> None:
         """Test method for meta."""
-
-        class TestModel3(BaseModel):
-            """Test model for meta."""
-
-            name: models.CharField[str, str] = models.CharField(max_length=100)
-            value: models.IntegerField[int, int] = models.IntegerField()
-
-            class Meta(BaseModel.Meta):
-                app_label = "test_app"
-
-        test_instance = TestModel3(name="test", value=42)
+        test_instance = MetaBaseModel(name="test", value=42)
         assert_with_msg(
             test_instance.meta == test_instance._meta,  # noqa: SLF001
             "Expected meta to return _meta",
@@ -1,9 +1,10 @@
 """Test module for sql.py."""
 
 import pytest
+from django.db import connection, transaction
 from pyrig.src.testing.assertions import assert_with_msg
 
-from winidjango.src.db.sql import execute_sql
+from winidjango.src.db.sql import execute_many_sql, execute_sql, iter_sql
 
 
 @pytest.mark.django_db
@@ -23,3 +24,54 @@ def test_execute_sql() -> None:
         len(rows) == 0,
         f"Expected 0 rows, got {len(rows)}",
     )
+
+    # run several queries in one transaction on the same cursor
+    with transaction.atomic(), connection.cursor() as cursor:
+        execute_sql("CREATE TABLE shared_cursor_table (id INTEGER)", cursor=cursor)
+        columns, rows = execute_sql("SELECT * FROM shared_cursor_table", cursor=cursor)
+
+    assert_with_msg(
+        columns == ["id"] and rows == [],
+        f"Expected columns ['id'] and no rows, got {columns} and {rows}",
+    )
+
+
+@pytest.mark.django_db
+def test_execute_many_sql() -> None:
+    """Test func for execute_many_sql."""
+    # create, fill and read a table through one cursor
+    results = execute_many_sql(
+        [
+            (
+                "CREATE TABLE many_sql_table (id INTEGER PRIMARY KEY, name TEXT)",
+                None,
+            ),
+            (
+                "INSERT INTO many_sql_table (id, name) VALUES (%(id)s, %(name)s)",
+                {"id": 1, "name": "test"},
+            ),
+            ("SELECT * FROM many_sql_table", None),
+        ]
+    )
+
+    expected_results = [([], []), ([], []), (["id", "name"], [(1, "test")])]
+    assert_with_msg(
+        results == expected_results,
+        f"Expected {expected_results}, got {results}",
+    )
+
+
+@pytest.mark.django_db
+def test_iter_sql() -> None:
+    """Test func for iter_sql."""
+    execute_sql("CREATE TABLE iter_sql_table (id INTEGER PRIMARY KEY)")
+    for id_ in range(1, 6):
+        execute_sql("INSERT INTO iter_sql_table (id) VALUES (%(id)s)", {"id": id_})
+
+    # rows are yielded across several fetches
+    rows = list(iter_sql("SELECT id FROM iter_sql_table ORDER BY id", chunk_size=2))
+    expected_rows = [(1,), (2,), (3,), (4,), (5,)]
+    assert_with_msg(
+        rows == expected_rows,
+        f"Expected {expected_rows}, got {rows}",
+    )
@@ -12,7 +12,7 @@ from django.db.models import Model
 from winiutils.src.data.dataframe.cleaning import CleaningDF
 
 from winidjango.src.commands.base.base import ABCBaseCommand
-from winidjango.src.db.bulk import bulk_create_bulks_in_steps
+from winidjango.src.db.bulk import STANDARD_BULK_SIZE, bulk_create_bulks_in_steps
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +25,13 @@ class ImportDataBaseCommand(ABCBaseCommand):
     """
 
     @abstractmethod
-    def handle_import(self) -> pl.DataFrame:
+    def handle_import(self) -> pl.DataFrame | pl.LazyFrame:
         """Handle importing the data from the source.
 
         The data is possibly dirty and the job of this class to standardize the process
         of importing the data.
+        A LazyFrame (e.g. from pl.scan_csv) can be returned to let polars optimize
+        reading the source. It is collected once before it is cleaned.
         """
 
     @abstractmethod
@@ -63,6 +65,8 @@ class ImportDataBaseCommand(ABCBaseCommand):
         and then imports it to the database.
         """
         data_df = self.handle_import()
+        if isinstance(data_df, pl.LazyFrame):
+            data_df = data_df.collect()
 
         cleaning_df_cls = self.get_cleaning_df_cls()
         self.cleaning_df = cleaning_df_cls(data_df)
@@ -70,7 +74,12 @@ class ImportDataBaseCommand(ABCBaseCommand):
         self.import_to_db()
 
     def import_to_db(self) -> None:
-        """Import the cleaned data to the database."""
+        """Import the cleaned data to the database.
+
+        The bulks are created in steps of the batch size option if it is given,
+        otherwise in steps of STANDARD_BULK_SIZE.
+        """
         bulks_by_model = self.get_bulks_by_model(df=self.cleaning_df.df)
 
-        bulk_create_bulks_in_steps(bulks_by_model)
+        step = self.options.get(self.Options.BATCH_SIZE) or STANDARD_BULK_SIZE
+        bulk_create_bulks_in_steps(bulks_by_model, step=step)
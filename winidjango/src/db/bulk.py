@@ -5,13 +5,14 @@ including bulk operations and validation. These utilities help with
 efficiently managing large amounts of data in Django applications.
 """
 
-from collections import defaultdict
+import os
+from collections import Counter, defaultdict
 from collections.abc import Callable, Generator, Iterable
-from functools import partial
-from itertools import islice
+from itertools import chain, islice
 from typing import TYPE_CHECKING, Any, Literal, cast, get_args, overload
 
-from django.db import router, transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router, transaction
 from django.db.models import (
     Field,
     Model,
@@ -20,8 +21,9 @@ from django.db.models import (
 from django.db.models.deletion import Collector
 from winiutils.src.iterating.concurrent.multithreading import multithread_loop
 
+from winidjango.src.db.fields import get_model_meta
 from winidjango.src.db.models import (
-    hash_model_instance,
+    get_model_instance_hasher,
     topological_sort_models,
 )
 
@@ -43,6 +45,31 @@ MODE_DELETE = MODES[2]
 STANDARD_BULK_SIZE = 1000
 
 
+def get_standard_db_batch_size() -> int:
+    """Get the db batch size from the WINIDJANGO_BULK_BATCH_SIZE env variable.
+
+    Returns:
+        int: The batch size from the environment variable, 500 if it is not set.
+
+    Raises:
+        ValueError: If the environment variable is not a positive integer.
+    """
+    value = os.environ.get("WINIDJANGO_BULK_BATCH_SIZE", "500")
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        msg = f"WINIDJANGO_BULK_BATCH_SIZE must be a positive integer, got {value!r}"
+        raise ValueError(msg)
+    return batch_size
+
+
+# max number of objects django puts into a single INSERT or UPDATE query
+# keeps queries below the parameter limits of the database drivers
+STANDARD_DB_BATCH_SIZE = get_standard_db_batch_size()
+
+
 def bulk_create_in_steps[TModel: Model](
     model: type[TModel],
     bulk: Iterable[TModel],
@@ -83,7 +110,8 @@ def bulk_update_in_steps[TModel: Model](
 
     Args:
         model (type[Model]): The Django model class to update.
-        bulk (Iterable[Model]): A list of model instances to update.
+        bulk (Iterable[Model]): The model instances to update. Consumed one step
+            at a time, so iterators like QuerySet.iterator() are streamed.
         update_fields (list[str]): List of field names to update on the models.
         step (int, optional): The step size for bulk updates.
                               Defaults to STANDARD_BULK_SIZE.
@@ -111,7 +139,8 @@ def bulk_delete_in_steps[TModel: Model](
 
     Args:
         model (type[Model]): The Django model class to update.
-        bulk (Iterable[Model]): A list of model instances to delete.
+        bulk (Iterable[Model]): The model instances to delete. Consumed one step
+            at a time, so iterators like QuerySet.iterator() are streamed.
         step (int, optional): The step size for bulk deletions.
                               Defaults to STANDARD_BULK_SIZE.
 
@@ -171,8 +200,9 @@ def bulk_method_in_steps[TModel: Model](
     """Execute bulk operations on model instances in steps with transaction handling.
 
     This is the core function that handles bulk create, update, or delete operations
-    by dividing the work into manageable chunks and processing them with multithreading.
-    It includes transaction safety checks and delegates to the atomic version.
+    by dividing the work into manageable chunks and processing them one after
+    another on the caller's connection. It logs when it runs inside an outer
+    transaction and delegates to the atomic version.
 
     Args:
         model (type[Model]): The Django model class to perform operations on.
@@ -189,13 +219,17 @@ def bulk_method_in_steps[TModel: Model](
             - delete: tuple of (total_count, count_by_model_dict)
             - None if bulk is empty
     """
+    # empty bulks need no transaction, only lists and tuples are checked
+    # as other iterables like querysets would be evaluated or consumed
+    if isinstance(bulk, list | tuple) and not bulk:
+        return flatten_bulk_in_steps_result(result=[], mode=mode)
+
     # check if we are inside a transaction.atomic block
     _in_atomic_block = transaction.get_connection().in_atomic_block
     if _in_atomic_block:
         logger.info(
-            "BE CAREFUL USING BULK OPERATIONS INSIDE A BROADER TRANSACTION BLOCK. "
-            "BULKING WITH BULKS THAT DEPEND ON EACH OTHER CAN CAUSE "
-            "INTEGRITY ERRORS OR POTENTIAL OTHER ISSUES."
+            "Bulk operation inside an outer transaction, its chunks are only "
+            "committed or rolled back together with that transaction."
         )
     return bulk_method_in_steps_atomic(
         model=model, bulk=bulk, step=step, mode=mode, **kwargs
@@ -246,12 +280,10 @@ def bulk_method_in_steps_atomic[TModel: Model](
 ) -> int | tuple[int, dict[str, int]] | list[TModel]:
     """Bulk create, update or delete the given list of objects in steps.
 
-    WHEN BULK CREATING OR UPDATING A BULK
-    AND THEN A SECOND BULK THAT DEPENDS ON THE FIRST BULK,
-    YOU WILL RUN INTO A INTEGRITY ERROR IF YOU DO THE
-    ENTIRE THING IN AN @transaction.atomic DECORATOR.
-    REMOVE THE DECORATORS THAT ARE HIGHER UP THAN THE ONE OF THIS FUNCTION
-    TO AVOID THIS ERROR.
+    All chunks run in one transaction on the caller's connection, nested in an
+    outer transaction if there is one. So a second bulk that depends on a first
+    one can be created in the same outer transaction, as long as the first one
+    is created before it, like bulk_create_bulks_in_steps does.
 
     Args:
         model (type[Model]): The Django model class to perform operations on.
@@ -267,12 +299,21 @@ def bulk_method_in_steps_atomic[TModel: Model](
             - update: integer count of updated objects
             - delete: tuple of (total_count, count_by_model_dict)
             - None if bulk is empty
+
+    Note:
+        The chunks must run sequentially on the caller's thread. Worker threads
+        would use their own connections outside this transaction, not see its
+        uncommitted rows and not be rolled back with it. multithread_loop only
+        does this because get_step_chunks is a generator without a length, so
+        it falls back to a single worker and maps on the calling thread.
     """
     bulk_method = get_bulk_method(model=model, mode=mode, **kwargs)
 
     chunks = get_step_chunks(bulk=bulk, step=step)
 
-    # multithreading significantly increases speed
+    # chunks is a generator without a length, so multithread_loop maps the chunks
+    # on this thread and connection; a sized iterable would start worker threads
+    # that write outside this transaction
     result = multithread_loop(
         process_function=bulk_method,
         process_args=chunks,
@@ -286,18 +327,18 @@ def get_step_chunks(
 ) -> Generator[tuple[list[Model]], None, None]:
     """Yield chunks of the given size from the bulk.
 
+    The bulk is consumed lazily, so only one chunk is materialized at a time
+    and iterators or generators can be passed without building a full list.
+
     Args:
         bulk (Iterable[Model]): The bulk to chunk.
         step (int): The size of each chunk.
 
     Yields:
-        Generator[list[Model], None, None]: Chunks of the bulk.
+        Generator[tuple[list[Model]], None, None]: Chunks of the bulk.
     """
     bulk = iter(bulk)
-    while True:
-        chunk = list(islice(bulk, step))
-        if not chunk:
-            break
+    while chunk := list(islice(bulk, step)):
         yield (chunk,)  # bc concurrent_loop expects a tuple of args
 
 
@@ -328,6 +369,8 @@ def get_bulk_method(
     Creates and returns a function that performs the specified bulk operation
     (create, update, or delete) on a chunk of model instances. The returned
     function is configured with the provided kwargs.
+    Create and update split each chunk into queries of at most batch_size objects,
+    which defaults to STANDARD_DB_BATCH_SIZE.
 
     Args:
         model (type[Model]): The Django model class to perform operations on.
@@ -342,15 +385,22 @@ def get_bulk_method(
             on a chunk of model instances.
     """
     bulk_method: Callable[[list[Model]], list[Model] | int | tuple[int, dict[str, int]]]
+    if mode in (MODE_CREATE, MODE_UPDATE):
+        kwargs.setdefault("batch_size", STANDARD_DB_BATCH_SIZE)
+
     if mode == MODE_CREATE:
 
         def bulk_create_chunk(chunk: list[Model]) -> list[Model]:
+            if can_bulk_create_with_copy(model=model, objs=chunk, **kwargs):
+                return bulk_create_with_copy(model=model, objs=chunk)
             return model.objects.bulk_create(objs=chunk, **kwargs)
 
         bulk_method = bulk_create_chunk
     elif mode == MODE_UPDATE:
 
         def bulk_update_chunk(chunk: list[Model]) -> int:
+            if can_bulk_update_with_values(model=model, objs=chunk, **kwargs):
+                return bulk_update_with_values(model=model, objs=chunk, **kwargs)
             return model.objects.bulk_update(objs=chunk, **kwargs)
 
         bulk_method = bulk_update_chunk
@@ -418,46 +468,305 @@ def flatten_bulk_in_steps_result[TModel: Model](
         # join the results to get the total count of deleted objects
         result = cast("list[tuple[int, dict[str, int]]]", result)
         total_count = 0
-        count_sum_by_model: defaultdict[str, int] = defaultdict(int)
+        count_sum_by_model: Counter[str] = Counter()
         for count_sum, count_by_model in result:
             total_count += count_sum
-            for model_name, count in count_by_model.items():
-                count_sum_by_model[model_name] += count
+            count_sum_by_model.update(count_by_model)
         return (total_count, dict(count_sum_by_model))
     if mode == MODE_CREATE:
         # formated as [[obj1, obj2, ...], [obj1, obj2, ...], ...]
         result = cast("list[list[TModel]]", result)
-        return [item for sublist in result for item in sublist]
+        return list(chain.from_iterable(result))
 
     msg = f"Invalid method. Must be one of {MODES}"
     raise ValueError(msg)
 
 
 def bulk_delete(
-    model: type[Model], objs: Iterable[Model], **_: Any
+    model: type[Model],
+    objs: Iterable[Model],
+    batch_size: int = STANDARD_DB_BATCH_SIZE,
+    **_: Any,
 ) -> tuple[int, dict[str, int]]:
     """Delete model instances using Django's QuerySet delete method.
 
     Deletes the provided model instances from the database using Django's
     built-in delete functionality. Handles both individual model instances
     and QuerySets, and returns deletion statistics including cascade counts.
+    Model instances are deleted with one pk__in query per batch_size objects,
+    so large bulks stay below the parameter limits of the database drivers.
 
     Args:
         model (type[Model]): The Django model class to delete from.
         objs (list[Model]): A list of model instances to delete.
+        batch_size (int, optional): Max number of pks in one delete query.
+            Defaults to STANDARD_DB_BATCH_SIZE.
 
     Returns:
         tuple[int, dict[str, int]]: A tuple containing the total count of deleted
             objects and a dictionary mapping model names to their deletion counts.
+
+    Raises:
+        ValueError: If batch_size is not a positive integer.
     """
-    if not isinstance(objs, QuerySet):
-        objs = list(objs)
-        pks = [obj.pk for obj in objs]
-        query_set = model.objects.filter(pk__in=pks)
-    else:
-        query_set = objs
+    # a batch size below 1 would delete nothing without any error
+    if batch_size < 1:
+        msg = "Batch size must be a positive integer."
+        raise ValueError(msg)
+    if isinstance(objs, QuerySet):
+        return objs.delete()
+
+    pks = (obj.pk for obj in objs)
+    total_count = 0
+    count_sum_by_model: Counter[str] = Counter()
+    while pk_chunk := list(islice(pks, batch_size)):
+        count_sum, count_by_model = model.objects.filter(pk__in=pk_chunk).delete()
+        total_count += count_sum
+        count_sum_by_model.update(count_by_model)
+
+    return (total_count, dict(count_sum_by_model))
+
+
+def can_bulk_create_with_copy[TModel: Model](
+    model: type[TModel], objs: list[TModel], **kwargs: Any
+) -> bool:
+    """Check if the objects can be created with postgres COPY instead of INSERT.
+
+    COPY is much faster than INSERT for large bulks, but it can neither return
+    generated primary keys nor handle conflicts. So it is only used on postgres
+    with psycopg 3 for models without parents, when every object already has
+    its pk set and no bulk_create option other than batch_size is given.
+    Objects holding expressions, like Now() or an unset db_default, are left to
+    bulk_create as well, because COPY sends plain values.
+
+    Args:
+        model (type[Model]): The Django model class of the objects.
+        objs (list[Model]): The model instances to create.
+        **kwargs: The keyword arguments that would be passed to bulk_create.
+
+    Returns:
+        bool: True if bulk_create_with_copy can be used for the objects.
+    """
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != "postgresql":
+        return False
+    # only importable if a postgres driver is installed
+    from django.db.backends.postgresql.psycopg_any import (  # type: ignore[import-untyped]  # noqa: PLC0415
+        is_psycopg3,
+    )
+
+    meta = get_model_meta(model)
+    if (
+        not is_psycopg3
+        or meta.parents
+        or meta.proxy
+        or set(kwargs) - {"batch_size"}
+        or not objs
+    ):
+        return False
+    # expressions like Now() or DatabaseDefault can only be compiled by bulk_create
+    copied_fields = [field for field in meta.concrete_fields if not field.generated]
+    return all(
+        obj.pk is not None
+        and not any(
+            hasattr(getattr(obj, field.attname), "resolve_expression")
+            for field in copied_fields
+        )
+        for obj in objs
+    )
+
+
+def bulk_create_with_copy[TModel: Model](
+    model: type[TModel], objs: list[TModel]
+) -> list[TModel]:
+    """Create model instances with a single postgres COPY FROM STDIN.
+
+    Streams the rows through psycopg's copy protocol instead of sending
+    INSERT statements. Values are prepared the same way as in bulk_create,
+    including auto_now fields and foreign keys to related objects
+    that were saved after they were assigned.
+    Use can_bulk_create_with_copy to check if this is possible.
+
+    Args:
+        model (type[Model]): The Django model class of the objects.
+        objs (list[Model]): The model instances to create, all with their pk set.
 
-    return query_set.delete()
+    Returns:
+        list[Model]: The created objects.
+    """
+    connection = connections[router.db_for_write(model)]
+    meta = get_model_meta(model)
+    fields = [field for field in meta.concrete_fields if not field.generated]
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    sql = f"COPY {quote_name(meta.db_table)} ({columns}) FROM STDIN"
+
+    with connection.cursor() as cursor, cursor.copy(sql) as copy:
+        for obj in objs:
+            # same as bulk_create, sets fk ids from related objects saved meanwhile
+            obj._prepare_related_fields_for_save(  # type: ignore[attr-defined]  # noqa: SLF001
+                operation_name="bulk_create"
+            )
+            copy.write_row(
+                [
+                    field.get_db_prep_save(field.pre_save(obj, add=True), connection)
+                    for field in fields
+                ]
+            )
+
+    for obj in objs:
+        obj._state.adding = False  # noqa: SLF001
+        obj._state.db = connection.alias  # noqa: SLF001
+    return objs
+
+
+def can_bulk_update_with_values[TModel: Model](
+    model: type[TModel], objs: list[TModel], fields: list[str], **kwargs: Any
+) -> bool:
+    """Check if the objects can be updated with one postgres UPDATE FROM VALUES.
+
+    Django's bulk_update builds a CASE WHEN expression per field with one branch
+    per object, which postgres parses slowly for large bulks. Joining against a
+    VALUES list is much cheaper. It is only used on postgres for models without
+    parents, when every object has a unique pk set, the fields are concrete
+    non pk fields with plain values and no bulk_update option other than
+    batch_size is given. Everything else is left to bulk_update and its
+    validation.
+
+    Args:
+        model (type[Model]): The Django model class of the objects.
+        objs (list[Model]): The model instances to update.
+        fields (list[str]): The names of the fields to update.
+        **kwargs: The keyword arguments that would be passed to bulk_update.
+
+    Returns:
+        bool: True if bulk_update_with_values can be used for the objects.
+    """
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor != "postgresql":
+        return False
+
+    meta = get_model_meta(model)
+    # bulk_update raises its own error for a batch size that is not positive
+    batch_size = kwargs.get("batch_size")
+    if (
+        meta.parents
+        or meta.proxy
+        or set(kwargs) - {"batch_size"}
+        or (batch_size is not None and batch_size < 1)
+    ):
+        return False
+    # a pk joined twice updates its row from either VALUES row, while
+    # bulk_update applies the first duplicate
+    if not objs or not fields or len({obj.pk for obj in objs}) != len(objs):
+        return False
+    try:
+        requested_fields = [meta.get_field(name) for name in fields]
+    except FieldDoesNotExist:
+        return False
+    update_fields = [
+        field
+        for field in requested_fields
+        if isinstance(field, Field)
+        and field.concrete
+        and not field.many_to_many
+        and not field.primary_key
+        and not field.generated
+    ]
+    if len(update_fields) != len(requested_fields):
+        return False
+    # expressions like F() can only be compiled by bulk_update
+    return all(
+        obj.pk is not None
+        and not any(
+            hasattr(getattr(obj, field.attname), "resolve_expression")
+            for field in update_fields
+        )
+        for obj in objs
+    )
+
+
+def bulk_update_with_values[TModel: Model](
+    model: type[TModel],
+    objs: list[TModel],
+    fields: list[str],
+    batch_size: int | None = STANDARD_DB_BATCH_SIZE,
+) -> int:
+    """Update model instances with postgres UPDATE FROM VALUES statements.
+
+    Sends one statement per batch_size objects that joins the table with a
+    VALUES list of the pks and new values. Values are prepared the same way
+    as in bulk_update, including foreign keys to related objects that were
+    saved after they were assigned. Like in bulk_update, a field given more
+    than once, e.g. by name and attname, is only updated once.
+    Use can_bulk_update_with_values to check if this is possible.
+
+    Args:
+        model (type[Model]): The Django model class of the objects.
+        objs (list[Model]): The model instances to update, all with their pk set.
+        fields (list[str]): The names of the fields to update.
+        batch_size (int | None, optional): Max number of objects in one
+            statement. None updates all objects in one statement.
+            Defaults to STANDARD_DB_BATCH_SIZE.
+
+    Returns:
+        int: The number of updated rows.
+    """
+    connection = connections[router.db_for_write(model)]
+    meta = get_model_meta(model)
+    # keyed by attname like bulk_update, a column can only be assigned once
+    update_fields = list(
+        {
+            field.attname: field
+            for field in (
+                cast("Field[Any, Any]", meta.get_field(name)) for name in fields
+            )
+        }.values()
+    )
+    batch_size = batch_size or len(objs)
+    pk_field = meta.pk
+    columns = [pk_field, *update_fields]
+    quote_name = connection.ops.quote_name
+    table = quote_name(meta.db_table)
+    pk_column = quote_name(pk_field.column)
+    assignments = ", ".join(
+        f"{quote_name(field.column)} = v.{quote_name(field.column)}"
+        for field in update_fields
+    )
+    # VALUES parameters are untyped, the casts give them the column types
+    row_sql = (
+        "(" + ", ".join(f"%s::{field.db_type(connection)}" for field in columns) + ")"
+    )
+    column_names = ", ".join(quote_name(field.column) for field in columns)
+
+    updated = 0
+    with (
+        transaction.atomic(using=connection.alias, savepoint=False),
+        connection.cursor() as cursor,
+    ):
+        for start in range(0, len(objs), batch_size):
+            batch = objs[start : start + batch_size]
+            params: list[Any] = []
+            for obj in batch:
+                # same as bulk_update, sets fk ids from related objects saved meanwhile
+                obj._prepare_related_fields_for_save(  # type: ignore[attr-defined]  # noqa: SLF001
+                    operation_name="bulk_update", fields=update_fields
+                )
+                params.extend(
+                    field.get_db_prep_save(getattr(obj, field.attname), connection)
+                    for field in columns
+                )
+            # only quoted names are formatted in, the values are parameters
+            sql = (
+                f"UPDATE {table} SET {assignments} "  # noqa: S608
+                f"FROM (VALUES {', '.join([row_sql] * len(batch))}) "
+                f"AS v ({column_names}) "
+                f"WHERE {table}.{pk_column} = v.{pk_column}"
+            )
+            cursor.execute(sql, params)
+            updated += cursor.rowcount
+
+    return updated
 
 
 def bulk_create_bulks_in_steps[TModel: Model](
@@ -480,16 +789,33 @@ def bulk_create_bulks_in_steps[TModel: Model](
     Returns:
         dict[type[Model], list[Model]]: Dictionary mapping model classes to lists
             of created instances.
+
+    Note:
+        All bulks are created in one transaction, so the whole graph is
+        committed once instead of once per model. The foreign keys between
+        the bulks are satisfied by creating them in dependency order. On
+        postgres, django creates foreign keys as DEFERRABLE INITIALLY DEFERRED,
+        so they are only checked at the commit.
+        This relies on every chunk being created on the caller's thread and
+        connection, see bulk_method_in_steps_atomic. A chunk created in a worker
+        thread would not be part of this transaction.
     """
+    if not bulk_by_class:
+        return {}
+
     # order the bulks in order of creation depending how they depend on each other
     models_ = list(bulk_by_class.keys())
     ordered_models = topological_sort_models(models=models_)
 
     results: dict[type[TModel], list[TModel]] = {}
-    for model_ in ordered_models:
-        bulk = bulk_by_class[model_]
-        result = bulk_create_in_steps(model=model_, bulk=bulk, step=step)
-        results[model_] = result
+    with transaction.atomic():
+        for model_ in ordered_models:
+            bulk = bulk_by_class[model_]
+            # the dependency order makes the nested bulks safe, so skip the
+            # warning bulk_method_in_steps logs inside a transaction
+            results[model_] = bulk_method_in_steps_atomic(
+                model=model_, bulk=bulk, step=step, mode=MODE_CREATE
+            )
 
     return results
 
@@ -515,6 +841,8 @@ def get_differences_between_bulks(
 
     Raises:
         ValueError: If the two bulks contain different model types.
+            Only the first object of each bulk is checked, so each bulk is
+            expected to contain a single model type.
 
     Returns:
         tuple[list[Model], list[Model], list[Model], list[Model]]: A tuple containing:
@@ -530,46 +858,32 @@ def get_differences_between_bulks(
         msg = "Both bulks must be of the same model type."
         raise ValueError(msg)
 
-    hash_model_instance_with_fields = partial(
-        hash_model_instance,
-        fields=fields,
-    )
+    # resolves the field names once for all objects of both bulks
+    hash_model_instance_with_fields = get_model_instance_hasher(fields)
     # Precompute hashes and map them directly to models in a single pass for both bulks
     hashes1 = list(map(hash_model_instance_with_fields, bulk1))
     hashes2 = list(map(hash_model_instance_with_fields, bulk2))
 
-    # Convert keys to sets for difference operations
     set1, set2 = set(hashes1), set(hashes2)
 
-    # Calculate differences between sets
-    # Find differences and intersection with original order preserved
+    # Classify every object in a single pass per bulk by probing the other set.
     # Important, we need to return the original objects that are the same in memory,
-    # so in_1_not_2 and in_2_not_1
-    in_1_not_2 = set1 - set2
-    in_1_not_2_list = [
-        model
-        for model, hash_ in zip(bulk1, hashes1, strict=False)
-        if hash_ in in_1_not_2
-    ]
-
-    in_2_not_1 = set2 - set1
-    in_2_not_1_list = [
-        model
-        for model, hash_ in zip(bulk2, hashes2, strict=False)
-        if hash_ in in_2_not_1
-    ]
-
-    in_1_and_2 = set1 & set2
-    in_1_and_2_from_1 = [
-        model
-        for model, hash_ in zip(bulk1, hashes1, strict=False)
-        if hash_ in in_1_and_2
-    ]
-    in_1_and_2_from_2 = [
-        model
-        for model, hash_ in zip(bulk2, hashes2, strict=False)
-        if hash_ in in_1_and_2
-    ]
+    # in their original order, so we iterate the bulks and not the sets
+    in_1_not_2_list: list[Model] = []
+    in_1_and_2_from_1: list[Model] = []
+    for model, hash_ in zip(bulk1, hashes1, strict=True):
+        if hash_ in set2:
+            in_1_and_2_from_1.append(model)
+        else:
+            in_1_not_2_list.append(model)
+
+    in_2_not_1_list: list[Model] = []
+    in_1_and_2_from_2: list[Model] = []
+    for model, hash_ in zip(bulk2, hashes2, strict=True):
+        if hash_ in set1:
+            in_1_and_2_from_2.append(model)
+        else:
+            in_2_not_1_list.append(model)
 
     return in_1_not_2_list, in_2_not_1_list, in_1_and_2_from_1, in_1_and_2_from_2
 
@@ -590,6 +904,11 @@ def simulate_bulk_deletion(
     Returns:
         dict[type[Model], set[Model]]: Dictionary mapping model classes to sets
             of objects that would be deleted, including cascade deletions.
+
+    Note:
+        The objects are returned in sets, as Django's Collector already stores
+        them in sets. This is no extra cost on top of the collection and only
+        objects with a pk can be collected, so every object can be hashed.
     """
     if not entries:
         return {}
@@ -610,7 +929,10 @@ def simulate_bulk_deletion(
 
     # Add fast deletes (explicitly expand querysets)
     for queryset in collector.fast_deletes:
-        deletion_summary[queryset.model].update(list(queryset))
+        # iterate so the rows are not kept a second time in the queryset cache
+        deletion_summary[queryset.model].update(
+            queryset.iterator(chunk_size=STANDARD_DB_BATCH_SIZE)
+        )
 
     return deletion_summary
 
@@ -631,6 +953,10 @@ def multi_simulate_bulk_deletion(
     Returns:
         dict[type[Model], set[Model]]: Dictionary mapping model classes to sets
             of all objects that would be deleted across all simulations.
+
+    Note:
+        The simulations run one after another on the caller's connection, so
+        they see rows that are not yet committed by an open transaction.
     """
     deletion_summaries = [
         simulate_bulk_deletion(model, entry) for model, entry in entries.items()
@@ -97,5 +97,11 @@ def get_fields[TModel: Model](
         True
         >>> 'email' in field_names
         True
+
+    Note:
+        Django already caches the fields per model and expires that cache when
+        the app registry changes, e.g. when a model with a relation to this one
+        is registered. So the result is deliberately not cached here again,
+        as that would keep outdated reverse relations.
     """
     return get_model_meta(model).get_fields()
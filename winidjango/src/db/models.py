@@ -5,15 +5,16 @@ including hashing, topological sorting, and database operations.
 These utilities help with efficient and safe database interactions.
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from graphlib import TopologicalSorter
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Self, cast
 
 from django.db.models import DateTimeField, Field, Model
 from django.db.models.fields.related import ForeignKey, ForeignObjectRel
-from django.forms.models import model_to_dict
 
-from winidjango.src.db.fields import get_field_names, get_fields
+from winidjango.src.db.fields import get_field_names, get_model_meta
 
 if TYPE_CHECKING:
     from django.contrib.contenttypes.fields import GenericForeignKey
@@ -64,20 +65,81 @@ def topological_sort_models[TModel: Model](
         - Self-referential foreign keys are ignored to avoid self-loops
         - Only relationships between models in the input list are considered
     """
+    return list(get_models_topological_sorter(models).static_order())
+
+
+def topological_layers[TModel: Model](
+    models: list[type[TModel]],
+) -> list[list[type[TModel]]]:
+    """Group Django models into layers of foreign key dependency order.
+
+    Like topological_sort_models, but each layer holds the models whose
+    dependencies are all in earlier layers. The models of one layer do not
+    depend on each other. Processing a layer concurrently needs committed data
+    or a separate transaction per worker, because worker threads use their own
+    connections and do not see rows the caller has not committed.
+
+    Args:
+        models (list[type[Model]]): A list of Django model classes to group
+            based on their foreign key dependencies.
+
+    Returns:
+        list[list[type[Model]]]: The layers in dependency order. Concatenated
+            they form a valid order for topological_sort_models.
+
+    Raises:
+        graphlib.CycleError: If there are circular dependencies between models
+            that cannot be resolved.
+
+    Example:
+        >>> # Book has ForeignKeys to Author and Publisher
+        >>> topological_layers([Book, Author, Publisher])
+        [[<class 'Author'>, <class 'Publisher'>], [<class 'Book'>]]
+    """
+    ts = get_models_topological_sorter(models)
+    ts.prepare()
+
+    layers: list[list[type[TModel]]] = []
+    while ts.is_active():
+        layer = list(ts.get_ready())
+        ts.done(*layer)
+        layers.append(layer)
+    return layers
+
+
+def get_models_topological_sorter[TModel: Model](
+    models: list[type[TModel]],
+) -> TopologicalSorter[type[TModel]]:
+    """Build a TopologicalSorter of Django models by their foreign keys.
+
+    Each model is added with the models it references through a ForeignKey
+    as its predecessors. Only relationships between models in the input list
+    are considered and self-referential foreign keys are ignored.
+
+    Args:
+        models (list[type[Model]]): The Django model classes to add.
+
+    Returns:
+        TopologicalSorter[type[Model]]: The sorter with all models added and
+            not yet prepared.
+    """
     ts: TopologicalSorter[type[TModel]] = TopologicalSorter()
+    # a set makes the membership check per foreign key O(1) instead of O(V)
+    models_set = set(models)
 
     for model in models:
+        # foreign keys are concrete fields, so reverse relations are not walked
         deps = {
             cast("type[TModel]", field.related_model)
-            for field in get_fields(model)
+            for field in get_model_meta(model).concrete_fields
             if isinstance(field, ForeignKey)
             and isinstance(field.related_model, type)
-            and field.related_model in models
+            and field.related_model in models_set
             and field.related_model is not model
         }
         ts.add(model, *deps)
 
-    return list(ts.static_order())
+    return ts
 
 
 def hash_model_instance(
@@ -102,14 +164,54 @@ def hash_model_instance(
         int: The hash value representing the instance's data
 
     """
-    if instance.pk:
-        return hash(instance.pk)
-
-    field_names = get_field_names(fields)
-    model_dict = model_to_dict(instance, fields=field_names)
-    sorted_dict = dict(sorted(model_dict.items()))
-    values = (type(instance), tuple(sorted_dict.items()))
-    return hash(values)
+    # saved instances hash by pk alone, so the fields are not resolved for them
+    pk = instance.pk
+    if pk:
+        return hash(pk)
+    return get_model_instance_hasher(fields)(instance)
+
+
+def get_model_instance_hasher(
+    fields: "list[Field[Any, Any] | ForeignObjectRel | GenericForeignKey]",
+) -> Callable[[Model], int]:
+    """Get a function that hashes model instances like hash_model_instance.
+
+    The field names are resolved once when the hasher is created and the values
+    are read with one attrgetter per model, so hashing many instances with the
+    same fields does not repeat that work per instance.
+    Like model_to_dict, only editable concrete fields are hashed.
+
+    Args:
+        fields (list[Field]): The fields to hash
+
+    Returns:
+        Callable[[Model], int]: A function that hashes a model instance.
+    """
+    field_names = frozenset(get_field_names(fields))
+    getters: dict[type[Model], Callable[[Model], Any]] = {}
+
+    def get_values_getter(model: type[Model]) -> Callable[[Model], Any]:
+        attnames = sorted(
+            (field.name, field.attname)
+            for field in get_model_meta(model).concrete_fields
+            if field.editable and field.name in field_names
+        )
+        if not attnames:
+            return lambda _instance: ()
+        return attrgetter(*(attname for _name, attname in attnames))
+
+    def hash_instance(instance: Model) -> int:
+        pk = instance.pk
+        if pk:
+            return hash(pk)
+
+        model = type(instance)
+        getter = getters.get(model)
+        if getter is None:
+            getter = getters[model] = get_values_getter(model)
+        return hash((model, getter(instance)))
+
+    return hash_instance
 
 
 class BaseModel(Model):
@@ -1,12 +1,18 @@
 """Module for database operations with sql."""
 
-from typing import Any
+from collections.abc import Generator, Iterable
+from typing import TYPE_CHECKING, Any
 
 from django.db import connection
 
+if TYPE_CHECKING:
+    from django.db.backends.utils import CursorWrapper
+
 
 def execute_sql(
-    sql: str, params: dict[str, Any] | None = None
+    sql: str,
+    params: dict[str, Any] | None = None,
+    cursor: "CursorWrapper | None" = None,
 ) -> tuple[list[str], list[Any]]:
     """Execute raw SQL query and return column names with results.
 
@@ -15,9 +21,9 @@ def execute_sql(
     way to run custom SQL queries while maintaining Django's database
     connection management and parameter binding for security.
 
-    The function automatically handles cursor management and ensures proper
-    cleanup of database resources. Parameters are safely bound to prevent
-    SQL injection attacks.
+    Without a cursor, the function opens one and ensures proper cleanup of
+    database resources. A cursor passed in is used as is and left open for
+    the caller. Parameters are safely bound to prevent SQL injection attacks.
 
     Args:
         sql (str): The SQL query string to execute. Can contain parameter
@@ -25,6 +31,9 @@ def execute_sql(
         params (dict[str, Any] | None, optional): Dictionary of parameters
             to bind to the SQL query for safe parameter substitution.
             Defaults to None if no parameters are needed.
+        cursor (CursorWrapper | None, optional): An open cursor to execute the
+            query on, e.g. to run several queries in one transaction without
+            opening a cursor for each. Defaults to None, which opens a new one.
 
     Returns:
         tuple[list[str], list[Any]]: A tuple containing:
@@ -48,16 +57,90 @@ def execute_sql(
         (1, 'admin')
 
     Note:
-        - Uses Django's default database connection
-        - Automatically manages cursor lifecycle
+        - If cursor is None, uses Django's default database connection,
+          otherwise the connection of the given cursor
+        - If cursor is None, opens and closes its own cursor, otherwise the
+          caller manages the lifecycle of the given cursor
         - Parameters are safely bound to prevent SQL injection
-        - Returns all results in memory - use with caution for large datasets
+        - Returns all results in memory - use iter_sql for large datasets
+    """
+    if cursor is None:
+        with connection.cursor() as new_cursor:
+            return execute_sql(sql=sql, params=params, cursor=new_cursor)
+
+    cursor.execute(sql=sql, params=params)
+    # statements without a result have no description and nothing to fetch
+    if not cursor.description:
+        return [], []
+    column_names = [col[0] for col in cursor.description]
+    return column_names, cursor.fetchall()
+
+
+def execute_many_sql(
+    statements: Iterable[tuple[str, dict[str, Any] | None]],
+) -> list[tuple[list[str], list[Any]]]:
+    """Execute several raw SQL statements on one cursor and return their results.
+
+    Works like execute_sql for every statement, but opens the cursor only once,
+    so running setup statements followed by queries does not pay the cursor
+    and connection checks per statement.
+
+    Args:
+        statements (Iterable[tuple[str, dict[str, Any] | None]]): The SQL
+            statements to execute in order, each with its parameters or None.
+
+    Returns:
+        list[tuple[list[str], list[Any]]]: The column names and result rows of
+            every statement in order, empty lists for statements without a
+            result like DDL.
+
+    Example:
+        >>> (_, _), (columns, rows) = execute_many_sql(
+        ...     [
+        ...         ("CREATE TABLE item (id INTEGER PRIMARY KEY)", None),
+        ...         ("SELECT * FROM item", None),
+        ...     ]
+        ... )
+        >>> columns
+        ['id']
     """
     with connection.cursor() as cursor:
-        cursor.execute(sql=sql, params=params)
-        rows = cursor.fetchall()
-        column_names = (
-            [col[0] for col in cursor.description] if cursor.description else []
-        )
+        return [
+            execute_sql(sql=sql, params=params, cursor=cursor)
+            for sql, params in statements
+        ]
 
-    return column_names, rows
+
+def iter_sql(
+    sql: str, params: dict[str, Any] | None = None, chunk_size: int = 1000
+) -> Generator[Any, None, None]:
+    """Execute a raw SQL query and yield its result rows.
+
+    Works like execute_sql, but fetches the rows in chunks of chunk_size with
+    fetchmany instead of loading all of them with fetchall, so loops over
+    large results only keep one chunk of rows in memory. The cursor stays open
+    until the generator is exhausted or closed.
+
+    Args:
+        sql (str): The SQL query string to execute.
+        params (dict[str, Any] | None, optional): Dictionary of parameters
+            to bind to the SQL query. Defaults to None.
+        chunk_size (int, optional): The number of rows fetched at once.
+            Defaults to 1000.
+
+    Yields:
+        Any: The result rows, each a tuple of values.
+
+    Example:
+        >>> for row in iter_sql("SELECT id FROM auth_user"):
+        ...     print(row)
+        (1,)
+
+    Note:
+        Django uses client side cursors, so depending on the driver the
+        database result may still be buffered by the driver itself.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql=sql, params=params)
+        while rows := cursor.fetchmany(chunk_size):
+            yield from rows